@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+A local stand-in for LeetCode's GraphQL endpoint, serving a generated
+submission history, so the fetch_completed sync can be run and timed
+without network access or an account.
+
+    python -m benchmarks.graphql_stub --port 8765 --latency 50
+    python -m src.utils.fetch_completed --session x --csv-path /tmp/completed.csv \\
+        --endpoint http://127.0.0.1:8765/graphql
+
+    python -m benchmarks.graphql_stub --check
+
+--check serves the history on a free port, syncs it with one worker and
+with several, and fails unless both find exactly the problems the history
+has accepted submissions for.
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.utils.fetch_completed import (
+    PAGE_SIZE,
+    fetch_submissions,
+    make_session,
+    problem_slug,
+    slug_ids,
+    solved_problems,
+)
+
+DATA_DIR = "data"
+STATUSES = [
+    ("Accepted", 0.55),
+    ("Wrong Answer", 0.25),
+    ("Time Limit Exceeded", 0.1),
+    ("Runtime Error", 0.1),
+]
+# Share of submissions for problems newer than the catalog
+UNKNOWN_RATE = 0.02
+# Spread of the history, ending now
+YEARS = 3
+
+
+def generate_submissions(rng, all_problems, count):
+    """Submissions newest first, the order LeetCode lists them in"""
+    slugs = sorted(problem_slug(problem["Link"]) for problem in all_problems.values())
+    statuses, weights = zip(*STATUSES)
+    now = int(time.time())
+    timestamps = sorted(
+        (now - rng.randrange(YEARS * 365 * 86400) for _ in range(count)),
+        reverse=True,
+    )
+    return [
+        {
+            "titleSlug": (
+                f"unlisted-problem-{rng.randrange(1000)}"
+                if rng.random() < UNKNOWN_RATE
+                else rng.choice(slugs)
+            ),
+            "statusDisplay": rng.choices(statuses, weights=weights)[0],
+            "timestamp": str(timestamp),
+        }
+        for timestamp in timestamps
+    ]
+
+
+def make_handler(submissions, latency):
+    accepted = [s for s in submissions if s["statusDisplay"] == "Accepted"]
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            query = body.get("query", "")
+            variables = body.get("variables") or {}
+            time.sleep(latency)
+            if "recentAcSubmissionList" in query:
+                data = {"recentAcSubmissionList": accepted[: variables["limit"]]}
+            elif "submissionList" in query:
+                if "LEETCODE_SESSION=" not in self.headers.get("Cookie", ""):
+                    # What LeetCode answers without a login
+                    data = {"submissionList": None}
+                else:
+                    offset, limit = variables["offset"], variables["limit"]
+                    data = {
+                        "submissionList": {
+                            "hasNext": offset + limit < len(submissions),
+                            "submissions": submissions[offset : offset + limit],
+                        }
+                    }
+            else:
+                self.send_error(400, "Unsupported query")
+                return
+            payload = json.dumps({"data": data}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(submissions, port=0, latency=0.0):
+    """Starts the stand-in server on a background thread and returns it"""
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", port), make_handler(submissions, latency)
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def check(submissions, all_problems, workers):
+    """Syncs from a stand-in server with 1 and with workers workers"""
+    slugs = slug_ids(all_problems)
+    expected = solved_problems(submissions, slugs)
+    server = serve(submissions, latency=0.02)
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}/graphql"
+    ok = True
+    try:
+        for count in sorted({1, workers}):
+            session = make_session("stub", count)
+            start = time.perf_counter()
+            fetched = fetch_submissions(session, endpoint, PAGE_SIZE, count)
+            seconds = time.perf_counter() - start
+            session.close()
+            solved = solved_problems(fetched, slugs)
+            match = fetched == submissions and solved == expected
+            ok = ok and match
+            print(
+                f"{count} worker(s): {len(fetched)} submissions, "
+                f"{len(solved[0])} solved in {seconds:.2f}s, "
+                + ("matches" if match else "MISMATCH")
+            )
+    finally:
+        server.shutdown()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve a generated submission history like LeetCode's GraphQL API"
+    )
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument(
+        "--submissions", type=int, default=1000, help="Submissions in the history"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0, help="Milliseconds added to every reply"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Sync from a temporary server and verify the result instead",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Workers to --check with"
+    )
+    args = parser.parse_args()
+
+    with open(f"{DATA_DIR}/all_problems.json") as f:
+        all_problems = json.load(f)
+    submissions = generate_submissions(
+        random.Random(args.seed), all_problems, args.submissions
+    )
+    if args.check:
+        sys.exit(0 if check(submissions, all_problems, args.workers) else 1)
+
+    server = serve(submissions, args.port, args.latency / 1000)
+    print(
+        f"Serving {len(submissions)} submissions on http://127.0.0.1:{args.port}/graphql"
+    )
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
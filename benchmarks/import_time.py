@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Checks the CLI's cold-start import cost, so a module-level import creeping
+back into main.py does not go unnoticed.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --budget-ms 30 --repeat 10
+
+Every case runs main.py under `python -X importtime` and fails when its
+median import time is over budget, or when it imports a module its command
+should never need. Imports every interpreter makes on start-up, measured
+with `python -X importtime -c pass`, do not count.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# (arguments, modules the command must not import)
+CASES = [
+    (
+        ["--help"],
+        [
+            "numpy",
+            "requests",
+            "src.data.loader",
+            "src.ui.interactive",
+            "src.utils.problem_picker",
+        ],
+    ),
+    (
+        ["--info", "1"],
+        [
+            "numpy",
+            "requests",
+            "src.ui.interactive",
+            "src.utils.picker_session",
+            "src.utils.problem_picker",
+            "src.utils.problem_index",
+            "src.utils.name_search",
+        ],
+    ),
+    (["-k", "3"], ["requests", "src.ui.interactive", "src.utils.picker_session"]),
+]
+
+
+def import_times(command):
+    """Returns module -> (own, cumulative) import microseconds of command"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *command],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = (int(own), int(cumulative))
+    return modules
+
+
+def cli_import_time(arguments, startup):
+    """
+    Returns the microseconds main.py spends importing, and module -> own
+    time of what it imports. Modules every interpreter start imports (site,
+    .pth hooks of installed packages) are left out, so the total measures
+    the CLI rather than the environment.
+    """
+    modules = import_times(["main.py", *arguments])
+    own = {name: times[0] for name, times in modules.items() if name not in startup}
+    return sum(own.values()), own
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the CLI's import time")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=50,
+        help="Most total import time a command may take (median, in ms)",
+    )
+    parser.add_argument("--repeat", "-r", type=int, default=5, help="Runs per case")
+    args = parser.parse_args()
+
+    os.chdir(os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+    startup = set(import_times(["-c", "pass"]))
+    failures = []
+    for arguments, forbidden in CASES:
+        case = " ".join(arguments)
+        totals = []
+        for _ in range(args.repeat):
+            total, modules = cli_import_time(arguments, startup)
+            totals.append(total)
+        median = statistics.median(totals) / 1000
+        slowest = sorted(modules.items(), key=lambda item: item[1])[-3:]
+        print(
+            f"{case:<12} {median:7.1f} ms, slowest: "
+            + ", ".join(f"{name} {micros / 1000:.1f}" for name, micros in slowest)
+        )
+        if median > args.budget_ms:
+            failures.append(f"{case}: {median:.1f} ms over the {args.budget_ms} budget")
+        for name in forbidden:
+            if name in modules:
+                failures.append(f"{case}: imports {name}")
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
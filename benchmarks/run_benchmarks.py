@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Times the loader, picker and display hot paths against the shipped data and
+scaled-up copies of it, and writes the results as JSON.
+
+    python -m benchmarks.run_benchmarks --scales 1 10 100 -o bench_results.json
+    python -m benchmarks.run_benchmarks --baseline bench_results.json
+
+Every dataset is benchmarked from a temporary copy, so marks made while
+timing replacement picks never touch the real data/ directory.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from benchmarks.synthetic_data import generate_dataset
+
+DATA_DIR = "data"
+# Sizes of the shipped dataset, which --synthetic scales up
+SHIPPED_PROBLEMS = 1446
+SHIPPED_COMPANIES = 200
+SHIPPED_ATTEMPTS = 75
+
+# The filter combinations from the README examples, as main() would receive them
+PICK_CASES = [
+    ("default", {}),
+    ("-t arr", {"topic_list": ["arr"]}),
+    ("-t ll -k 10", {"topic_list": ["ll"], "k": 10}),
+    ("-d Medium -k 3", {"difficulty_list": ["Medium"], "k": 3}),
+    (
+        '-t "top sort" -d Hard -l all',
+        {"topic_list": ["top sort"], "difficulty_list": ["Hard"], "list": ["all"]},
+    ),
+    (
+        "-t dp -d Easy Medium -l all",
+        {"topic_list": ["dp"], "difficulty_list": ["Easy", "Medium"], "list": ["all"]},
+    ),
+    (
+        "-t arr -e graph -l all",
+        {"topic_list": ["arr"], "exclude_topics": ["graph"], "list": ["all"]},
+    ),
+    (
+        "-t ll -e recursion -l all",
+        {"topic_list": ["ll"], "exclude_topics": ["recursion"], "list": ["all"]},
+    ),
+    (
+        "-t graph -l google -p Top",
+        {"topic_list": ["graph"], "list": ["google"], "problem_type": "Top"},
+    ),
+    ("-l all -p Weighted", {"list": ["all"], "problem_type": "Weighted"}),
+]
+
+
+def scale_dataset(dest_dir, factor):
+    """
+    Writes the shipped data scaled by factor into dest_dir/data: every problem,
+    its company entries, topics and completed attempts are repeated factor
+    times under shifted problem IDs.
+    """
+    with open(os.path.join(DATA_DIR, "all_problems.json")) as f:
+        all_problems = json.load(f)
+    with open(os.path.join(DATA_DIR, "company_to_problems.json")) as f:
+        company_to_problems = json.load(f)
+    with open(os.path.join(DATA_DIR, "problem_to_companies.json")) as f:
+        problem_to_companies = json.load(f)
+    with open(os.path.join(DATA_DIR, "topics.json")) as f:
+        topics = json.load(f)
+    with open(os.path.join(DATA_DIR, "completed.csv")) as f:
+        completed = [line for line in f.read().splitlines() if line.strip()]
+
+    stride = max(int(key) for key in all_problems) + 1
+    copies = range(factor)
+
+    def shifted(key, copy):
+        return str(int(key) + copy * stride)
+
+    scaled_problems = {
+        shifted(key, copy): dict(problem, Name=f"{problem['Name']} {copy}")
+        for copy in copies
+        for key, problem in all_problems.items()
+    }
+    scaled_company_to_problems = {
+        company: {
+            duration: {
+                shifted(key, copy): frequency
+                for copy in copies
+                for key, frequency in problems.items()
+            }
+            for duration, problems in durations.items()
+        }
+        for company, durations in company_to_problems.items()
+    }
+    scaled_problem_to_companies = {
+        shifted(key, copy): companies
+        for copy in copies
+        for key, companies in problem_to_companies.items()
+    }
+    scaled_topics = {
+        "topics": {
+            topic: [int(shifted(i, copy)) for copy in copies for i in problem_ids]
+            for topic, problem_ids in topics["topics"].items()
+        },
+        "aliases": topics["aliases"],
+    }
+    scaled_completed = []
+    for copy in copies:
+        for line in completed:
+            leetcode_id, _, rest = line.partition(",")
+            if leetcode_id.strip().isdigit():
+                scaled_completed.append(f"{shifted(leetcode_id, copy)},{rest}")
+
+    data_dir = os.path.join(dest_dir, DATA_DIR)
+    os.makedirs(data_dir, exist_ok=True)
+    for name, data in [
+        ("all_problems.json", scaled_problems),
+        ("company_to_problems.json", scaled_company_to_problems),
+        ("problem_to_companies.json", scaled_problem_to_companies),
+        ("topics.json", scaled_topics),
+    ]:
+        with open(os.path.join(data_dir, name), "w") as f:
+            json.dump(data, f)
+    shutil.copy(os.path.join(DATA_DIR, "user.json"), data_dir)
+    with open(os.path.join(data_dir, "completed.csv"), "w") as f:
+        f.write("\n".join(scaled_completed))
+
+
+def measure(fn, repeat, setup=None):
+    """Runs fn repeat times and returns its timings in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def clear_cache():
+    shutil.rmtree(os.path.join(DATA_DIR, ".cache"), ignore_errors=True)
+
+
+def benchmark_dataset(repeat):
+    """Benchmarks the dataset in the current directory, returns {name: timings}"""
+    # Imported here, once main() has put the repository on sys.path
+    from src.data.loader import load_all_data, load_catalog, load_completed_list
+    from src.ui.display import print_info
+    from src.utils.picker_session import PickerSession
+    from src.utils.problem_picker import (
+        build_problem_mask,
+        list_companies,
+        pick_problems,
+    )
+
+    results = {}
+    results["load_all_data (cold)"] = measure(load_all_data, repeat, clear_cache)
+    results["load_all_data (warm)"] = measure(load_all_data, repeat)
+
+    user_data = load_all_data()[0]
+    results["load_completed_list (cold)"] = measure(
+        lambda: load_completed_list(user_data), repeat, clear_cache
+    )
+    results["load_completed_list (warm)"] = measure(
+        lambda: load_completed_list(user_data), repeat
+    )
+
+    # Build (and cache) the problem index up front so picks are timed warm
+    catalog = load_catalog()
+    index = catalog.index
+    for label, case in PICK_CASES:
+        list_names = case.get("list", ["blind75"])
+        pick = lambda: pick_problems(
+            catalog.user_data,
+            catalog.all_problems,
+            build_problem_mask(catalog, list_names),
+            catalog.topics,
+            case.get("topic_list") or list(catalog.topics),
+            case.get("exclude_topics"),
+            case.get("difficulty_list"),
+            case.get("k", 5),
+            case.get("problem_type", "Random"),
+            index=index,
+            companies=list_companies(catalog, list_names),
+        )
+        results[f"pick_problems [{label}]"] = measure(pick, repeat)
+
+    leetcode_id = int(next(iter(catalog.all_problems)))
+
+    def info():
+        with contextlib.redirect_stdout(io.StringIO()):
+            print_info(
+                catalog.all_problems,
+                catalog.problem_to_companies,
+                catalog.my_companies,
+                leetcode_id,
+            )
+
+    results["print_info"] = measure(info, repeat)
+
+    # What interactive mode does for "easy": mark completed, then pick a replacement
+    session = PickerSession(catalog)
+    problem_mask = build_problem_mask(catalog, ["all"])
+    topic_list = list(catalog.topics)
+
+    def replacement_pick():
+        replacement = session.pick(problem_mask, topic_list, k=1)
+        if replacement:
+            session.mark_completed(replacement[0], "yes", "0", "5")
+
+    results["interactive replacement pick"] = measure(replacement_pick, repeat)
+    return results
+
+
+def summarize(timings):
+    return {
+        "min_ms": round(min(timings), 4),
+        "median_ms": round(statistics.median(timings), 4),
+        "mean_ms": round(statistics.mean(timings), 4),
+        "runs": len(timings),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, threshold):
+    """Prints every benchmark whose median regressed by more than threshold"""
+    with open(baseline_path) as f:
+        baseline = {(r["dataset"], r["name"]): r for r in json.load(f)["results"]}
+    regressions = 0
+    for result in results:
+        previous = baseline.get((result["dataset"], result["name"]))
+        if not previous or not previous["median_ms"]:
+            continue
+        ratio = result["median_ms"] / previous["median_ms"]
+        if ratio > 1 + threshold:
+            regressions += 1
+            print(
+                f"REGRESSION {result['dataset']} {result['name']}: "
+                f"{previous['median_ms']:.3f}ms -> {result['median_ms']:.3f}ms ({ratio:.2f}x)"
+            )
+    print(f"{regressions} regression(s) against {baseline_path}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the picker hot paths")
+    parser.add_argument(
+        "--scales",
+        nargs="+",
+        type=int,
+        default=[1, 10, 100],
+        help="Dataset sizes as multiples of the shipped data (1000 needs several GB)",
+    )
+    parser.add_argument("--repeat", "-r", type=int, default=20, help="Runs per case")
+    parser.add_argument(
+        "--output", "-o", default="bench_results.json", help="Where to write results"
+    )
+    parser.add_argument(
+        "--synthetic",
+        action="store_true",
+        help="Benchmark scales above 1 on generated data instead of repeated copies",
+    )
+    parser.add_argument("--baseline", help="Earlier results file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Slowdown (as a fraction) reported as a regression",
+    )
+    args = parser.parse_args()
+
+    root = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+    os.chdir(root)
+    sys.path.insert(0, root)
+
+    results = []
+    for factor in args.scales:
+        dataset = "shipped" if factor == 1 else f"x{factor}"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            print(f"Preparing {dataset} dataset...")
+            if factor == 1:
+                shutil.copytree(
+                    DATA_DIR,
+                    os.path.join(tmp_dir, DATA_DIR),
+                    ignore=shutil.ignore_patterns(".cache"),
+                )
+            elif args.synthetic:
+                generate_dataset(
+                    tmp_dir,
+                    num_problems=SHIPPED_PROBLEMS * factor,
+                    num_companies=SHIPPED_COMPANIES * factor,
+                    num_attempts=SHIPPED_ATTEMPTS * factor,
+                    seed=factor,
+                )
+            else:
+                scale_dataset(tmp_dir, factor)
+            os.chdir(tmp_dir)
+            try:
+                timings = benchmark_dataset(args.repeat)
+            finally:
+                os.chdir(root)
+        for name, values in timings.items():
+            result = {"dataset": dataset, "name": name, **summarize(values)}
+            results.append(result)
+            print(f"{dataset:>8} {name:<45} median {result['median_ms']:10.3f}ms")
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.baseline:
+        sys.exit(1 if compare(results, args.baseline, args.threshold) else 0)
+
+
+if __name__ == "__main__":
+    main()
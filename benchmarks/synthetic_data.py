@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Generates a synthetic catalog and practice history shaped like the shipped
+data, for load-testing the picker beyond 1,446 problems. Output is fully
+determined by the seed, and nothing is fetched from the network.
+
+    python -m benchmarks.synthetic_data --problems 100000 --companies 5000 \\
+        --attempts 1000000 --out /tmp/lcpp-synthetic
+
+writes all_problems.json, company_to_problems.json, problem_to_companies.json,
+topics.json, user.json and completed.csv into /tmp/lcpp-synthetic/data, so
+running main.py from /tmp/lcpp-synthetic uses it.
+"""
+import argparse
+import bisect
+import itertools
+import json
+import math
+import os
+import random
+import re
+from datetime import date, timedelta
+
+DATA_DIR = "data"
+
+# Distributions measured on the shipped data
+DIFFICULTIES = [("Easy", 0.27), ("Medium", 0.52), ("Hard", 0.21)]
+ACCEPTANCE = {"Easy": (57.2, 14.7), "Medium": (50.4, 13.1), "Hard": (42.7, 11.0)}
+ZERO_FREQUENCY_RATE = 0.25
+# company sizes fall off as rank ** -COMPANY_SIZE_EXPONENT
+COMPANY_SIZE_EXPONENT = 1.1
+LARGEST_COMPANY_SHARE = 0.6
+# (durations present, share of companies); windows are nested, shorter first
+DURATION_SHAPES = [
+    (["6months", "1year", "2year", "alltime"], 0.44),
+    (["alltime"], 0.33),
+    (["1year", "2year", "alltime"], 0.13),
+    (["2year", "alltime"], 0.10),
+]
+# share of a company's alltime problems also asked in each shorter window
+DURATION_SHARE = {"6months": 0.4, "1year": 0.62, "2year": 0.83, "alltime": 1.0}
+TOPICS_PER_PROBLEM = [(1, 0.52), (2, 0.36), (3, 0.09), (4, 0.025), (5, 0.005)]
+SOLVE_RATE = {"Easy": 0.85, "Medium": 0.65, "Hard": 0.45}
+MEDIAN_MINUTES = {"Easy": 15, "Medium": 30, "Hard": 50}
+
+WELL_KNOWN_COMPANIES = [
+    "google",
+    "amazon",
+    "facebook",
+    "apple",
+    "microsoft",
+    "netflix",
+    "bloomberg",
+    "uber",
+    "adobe",
+    "linkedin",
+    "oracle",
+    "airbnb",
+    "twitter",
+    "bytedance",
+    "salesforce",
+    "ebay",
+    "yahoo",
+    "walmart",
+    "cisco",
+    "vmware",
+]
+FALLBACK_WORDS = (
+    "two sum array string tree graph path node list linked binary search sort "
+    "merge interval window subarray substring palindrome matrix island maximum "
+    "minimum number valid sequence stock profit cache design stream median"
+).split()
+FALLBACK_TOPICS = {
+    "topics": {"array": [], "string": [], "dp": [], "graph": [], "tree": []},
+    "aliases": {"arr": "array", "str": "string"},
+}
+
+
+def _weighted_choice(rng, options):
+    values, weights = zip(*options)
+    return rng.choices(values, weights=weights)[0]
+
+
+def _load_shipped(filename, fallback):
+    try:
+        with open(os.path.join(DATA_DIR, filename)) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return fallback
+
+
+def _name_words():
+    """Words used in the shipped problem names, so names look alike"""
+    all_problems = _load_shipped("all_problems.json", {})
+    words = set()
+    for problem in all_problems.values():
+        words.update(re.findall(r"[A-Za-z]+", problem.get("Name", "")))
+    return sorted(words) or FALLBACK_WORDS
+
+
+def generate_problems(rng, num_problems):
+    words = _name_words()
+    all_problems = {}
+    slugs = set()
+    for leetcode_id in range(1, num_problems + 1):
+        difficulty = _weighted_choice(rng, DIFFICULTIES)
+        mean, stdev = ACCEPTANCE[difficulty]
+        acceptance = min(95.0, max(5.0, rng.gauss(mean, stdev)))
+        frequency = (
+            0.0
+            if rng.random() < ZERO_FREQUENCY_RATE
+            else rng.lognormvariate(math.log(0.15), 1.3)
+        )
+        name = " ".join(rng.choice(words) for _ in range(rng.randint(2, 5))).title()
+        slug = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+        if slug in slugs:
+            slug = f"{slug}-{leetcode_id}"
+        slugs.add(slug)
+        all_problems[str(leetcode_id)] = {
+            "Acceptance": f"{acceptance:.1f}%",
+            "Difficulty": difficulty,
+            "Frequency": str(frequency),
+            "Link": f" https://leetcode.com/problems/{slug}",
+            "Name": name,
+        }
+    return all_problems
+
+
+def _popularity(all_problems):
+    """Problem IDs and cumulative weights favouring frequently asked problems"""
+    problem_ids = [int(key) for key in all_problems]
+    weights = [float(p["Frequency"]) + 0.02 for p in all_problems.values()]
+    return problem_ids, list(itertools.accumulate(weights))
+
+
+def _draw_distinct(rng, problem_ids, cum_weights, count):
+    """Draws count distinct problem IDs, favouring popular ones"""
+    count = min(count, len(problem_ids))
+    drawn = {}
+    while len(drawn) < count:
+        for problem_id in rng.choices(
+            problem_ids, cum_weights=cum_weights, k=count - len(drawn)
+        ):
+            drawn.setdefault(problem_id, None)
+    return list(drawn)[:count]
+
+
+def company_names(num_companies):
+    names = WELL_KNOWN_COMPANIES[:num_companies]
+    names += [f"company{i:05d}" for i in range(len(names), num_companies)]
+    return names
+
+
+def generate_companies(rng, all_problems, num_companies):
+    problem_ids, cum_weights = _popularity(all_problems)
+    largest = max(1, int(len(problem_ids) * LARGEST_COMPANY_SHARE))
+    company_to_problems = {}
+    for rank, company in enumerate(company_names(num_companies), 1):
+        size = max(1, int(largest * rank**-COMPANY_SIZE_EXPONENT))
+        asked = _draw_distinct(rng, problem_ids, cum_weights, size)
+        durations = _weighted_choice(rng, DURATION_SHAPES)
+        scores = {
+            problem_id: rng.lognormvariate(math.log(0.2), 1.0) for problem_id in asked
+        }
+        company_to_problems[company] = {}
+        for duration in durations:
+            window = asked[: max(1, int(len(asked) * DURATION_SHARE[duration]))]
+            company_to_problems[company][duration] = {
+                str(problem_id): str(scores[problem_id])
+                for problem_id in sorted(window, key=scores.get, reverse=True)
+            }
+    return company_to_problems
+
+
+def invert_companies(company_to_problems):
+    problem_to_companies = {}
+    for company in sorted(company_to_problems):
+        # A dict rather than a set keeps the output independent of hash seeds
+        asked = {}
+        for problems in company_to_problems[company].values():
+            asked.update(dict.fromkeys(problems))
+        for problem_id in asked:
+            problem_to_companies.setdefault(problem_id, []).append(company)
+    return problem_to_companies
+
+
+def generate_topics(rng, all_problems):
+    """Topic names and aliases follow the shipped topics.json"""
+    shipped = _load_shipped("topics.json", FALLBACK_TOPICS)
+    names = list(shipped["topics"])
+    # Topic sizes in the shipped data fall off roughly like 1 / rank
+    cum_weights = list(
+        itertools.accumulate(1 / rank for rank in range(1, len(names) + 1))
+    )
+    topics = {name: [] for name in names}
+    for key in all_problems:
+        count = min(_weighted_choice(rng, TOPICS_PER_PROBLEM), len(names))
+        chosen = set()
+        while len(chosen) < count:
+            chosen.add(
+                names[bisect.bisect(cum_weights, rng.random() * cum_weights[-1])]
+            )
+        for name in chosen:
+            topics[name].append(int(key))
+    return {"topics": topics, "aliases": shipped["aliases"]}
+
+
+def generate_user(rng, all_problems, company_to_problems):
+    problem_ids, cum_weights = _popularity(all_problems)
+    largest_companies = sorted(
+        company_to_problems,
+        key=lambda company: -len(company_to_problems[company]["alltime"]),
+    )
+    return {
+        "blind75": sorted(_draw_distinct(rng, problem_ids, cum_weights, 75)),
+        "faang": largest_companies[:5],
+        "my_companies": [],
+        "completed": [],
+        "hard": [],
+        "revisit": [],
+        "refresh": [],
+    }
+
+
+def generate_history(rng, all_problems, num_attempts, years, end_date):
+    """completed.csv lines, oldest first, revisiting popular problems more often"""
+    problem_ids, cum_weights = _popularity(all_problems)
+    days = max(1, int(years * 365))
+    start = end_date - timedelta(days=days)
+    offsets = sorted(rng.randrange(days) for _ in range(num_attempts))
+    chosen = rng.choices(problem_ids, cum_weights=cum_weights, k=num_attempts)
+    lines = []
+    for offset, problem_id in zip(offsets, chosen):
+        difficulty = all_problems[str(problem_id)]["Difficulty"]
+        was_solved = "yes" if rng.random() < SOLVE_RATE[difficulty] else "no"
+        num_errs = min(int(rng.expovariate(0.8)), 20)
+        minutes = max(
+            1, round(rng.lognormvariate(math.log(MEDIAN_MINUTES[difficulty]), 0.5))
+        )
+        day = start + timedelta(days=offset)
+        lines.append(f"{problem_id},{was_solved},{num_errs},{minutes},{day:%Y-%m-%d}")
+    return lines
+
+
+def generate_dataset(
+    out_dir,
+    num_problems,
+    num_companies,
+    num_attempts,
+    years=3,
+    seed=0,
+    end_date=date(2025, 7, 9),
+):
+    """Writes a synthetic data/ directory into out_dir"""
+    rng = random.Random(seed)
+    all_problems = generate_problems(rng, num_problems)
+    company_to_problems = generate_companies(rng, all_problems, num_companies)
+    problem_to_companies = invert_companies(company_to_problems)
+    topics = generate_topics(rng, all_problems)
+    user_data = generate_user(rng, all_problems, company_to_problems)
+    history = generate_history(rng, all_problems, num_attempts, years, end_date)
+
+    data_dir = os.path.join(out_dir, DATA_DIR)
+    os.makedirs(data_dir, exist_ok=True)
+    for filename, data in [
+        ("all_problems.json", all_problems),
+        ("company_to_problems.json", company_to_problems),
+        ("problem_to_companies.json", problem_to_companies),
+        ("topics.json", topics),
+        ("user.json", user_data),
+    ]:
+        with open(os.path.join(data_dir, filename), "w") as f:
+            json.dump(data, f)
+    with open(os.path.join(data_dir, "completed.csv"), "w") as f:
+        f.write("\n".join(history))
+    return data_dir
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic catalog and practice history"
+    )
+    parser.add_argument("--out", "-o", required=True, help="Directory to write into")
+    parser.add_argument("--problems", type=int, default=10000, help="Problem count")
+    parser.add_argument("--companies", type=int, default=1000, help="Company count")
+    parser.add_argument(
+        "--attempts", type=int, default=100000, help="Rows of completed.csv"
+    )
+    parser.add_argument(
+        "--years", type=float, default=3, help="Years of history to spread them over"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    data_dir = generate_dataset(
+        args.out, args.problems, args.companies, args.attempts, args.years, args.seed
+    )
+    print(f"Wrote synthetic data to {data_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,15 @@
 LeetCode Problem Picker (lcpp) - Legacy entry point
 This file provides backward compatibility with existing commands
 by importing functionality from the refactored modules.
+
+When a picker daemon is running (python -m src.utils.picker_daemon), commands
+are answered by it instead, skipping the data loading every run pays for.
 """
 import sys
-from main import main
+from src.utils.daemon_client import run_cli
 
 if __name__ == "__main__":
-    main()
+    if not run_cli(sys.argv[1:]):
+        from main import main
+
+        main()
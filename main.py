@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 import sys
 import argparse
-import os
-from src.data.loader import load_all_data
-from src.ui.display import print_info, show_helper_menu
-from src.utils.problem_picker import pick_problems
-from src.ui.interactive import interactive_mode
-from constants import topics
+from src.models.problem import SUPPORTED_PROBLEM_TYPES
+from src.utils.profiling import profile_destination, profiled, stage
 
+# Everything else is imported by the command that needs it, so a quick
+# command like --info never loads the picker, the interactive UI or NumPy
 
-def main():
+
+def build_parser():
     parser = argparse.ArgumentParser(description="LeetCode Problem Picker")
     parser.add_argument(
         "--interactive",
@@ -22,8 +21,8 @@ def main():
         "--topic_list",
         "-t",
         nargs="+",
-        default=topics.keys(),
-        help="List of subjects to filter on",
+        default=None,
+        help="List of subjects to filter on (default: all topics)",
     )
     parser.add_argument(
         "--exclude_topics",
@@ -37,7 +36,7 @@ def main():
         "-l",
         nargs="+",
         default=["blind75"],
-        help="Companies interested in (or files containing comma-delimited problems)",
+        help="Companies interested in, optionally as company:duration (e.g. google:6months), or user lists",
     )
     parser.add_argument(
         "--difficulty",
@@ -50,80 +49,217 @@ def main():
         "--num_problems", "-k", type=int, default=5, help="Number of problems"
     )
     parser.add_argument(
-        "--info", action="store", type=int, help="Get details on a problem ID"
+        "--problem_type",
+        "-p",
+        choices=SUPPORTED_PROBLEM_TYPES,
+        default="Random",
+        help="How to choose among matching problems",
+    )
+    parser.add_argument(
+        "--info", action="store", help="Get details on a problem ID or name"
+    )
+    parser.add_argument(
+        "--search", action="store", help="List the -k problems best matching a name"
+    )
+    parser.add_argument(
+        "--due",
+        action="store_true",
+        default=False,
+        help="List revisit/refresh problems due for review today",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        default=False,
+        help="Show completion rates, solve times and weekly progress",
     )
     parser.add_argument(
         "--help-menu", "-m", action="store_true", default=False, help="Show helper menu"
     )
+    parser.add_argument(
+        "--compact-marks",
+        action="store_true",
+        default=False,
+        help="Fold the hard/revisit/refresh marks journal into user.json",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="FILE",
+        help="Report per-stage timings as JSON on stderr, or append them to FILE",
+    )
+    parser.add_argument(
+        "--profile-dump", metavar="FILE", help="Dump cProfile stats of the run to FILE"
+    )
+    parser.add_argument(
+        "--trace-malloc",
+        metavar="FILE",
+        help="Dump a tracemalloc snapshot taken at the end of the run to FILE",
+    )
+    return parser
+
 
-    args = parser.parse_args()
+def print_selection(selected_problems, args):
+    if not selected_problems:
+        topic_str = ", ".join(args.topic_list)
+        exclude_str = ", ".join(args.exclude_topics) if args.exclude_topics else "none"
+        difficulty_str = ", ".join(args.difficulty) if args.difficulty else "any"
+        print(f"No problems found matching all criteria:")
+        print(f"Topics: {topic_str}")
+        print(f"Excluded topics: {exclude_str}")
+        print(f"Difficulty: {difficulty_str}")
+        print(
+            f"This may be because all matching problems have been completed, or due to topic exclusions."
+        )
+    else:
+        print(selected_problems)
 
-    # Load all data
-    user_data, problem_to_companies, company_to_problems, all_problems, my_companies = (
-        load_all_data()
+
+def info_command(args, catalog, session=None):
+    from src.ui.display import print_info
+
+    print_info(
+        catalog.all_problems,
+        catalog.problem_to_companies,
+        catalog.my_companies,
+        catalog.find_problem(args.info),
     )
 
-    # Build problem set based on arguments
-    problem_set = set()
 
-    if "all" in [e.lower() for e in args.list]:
-        problem_set = set(int(key) for key in all_problems.keys())
-    else:
-        for elem in args.list:
-            if elem in company_to_problems:
-                for duration in company_to_problems[elem]:
-                    problem_set.update(
-                        [
-                            int(leetcode_id)
-                            for leetcode_id in company_to_problems[elem][duration]
-                        ]
-                    )
-            elif elem.lower() in user_data:
-                problem_set.update(user_data[elem.lower()])
+def search_command(args, catalog, session=None):
+    from src.ui.display import print_matches
 
-    # Handle command options
-    if args.help_menu:
-        show_helper_menu(topics)
-        sys.exit(0)
+    print_matches(
+        catalog.all_problems,
+        catalog.name_index.search(args.search, args.num_problems),
+    )
 
-    if args.info:
-        print_info(all_problems, problem_to_companies, my_companies, args.info)
-    elif args.interactive:
-        interactive_mode(
-            user_data,
-            problem_set,
-            args,
-            all_problems,
-            problem_to_companies,
-            my_companies,
-            topics,
+
+def stats_command(args, catalog, session=None):
+    from src.ui.display import print_stats
+    from src.utils.progress_stats import progress_stats
+
+    print_stats(progress_stats(catalog))
+
+
+def due_command(args, catalog, session=None):
+    from src.utils.review_scheduler import load_reviews
+
+    reviews = session.reviews if session else load_reviews(catalog)
+    print(reviews.due(k=args.num_problems))
+
+
+def pick_command(args, catalog, session=None):
+    from src.utils.problem_picker import (
+        build_problem_mask,
+        build_skip_mask,
+        list_companies,
+        pick_problems,
+    )
+
+    # No topic filter means problems from any topic
+    if args.topic_list is None:
+        args.topic_list = list(catalog.topics)
+
+    if session:
+        selected_problems = session.pick(
+            build_problem_mask(catalog, args.list),
+            args.topic_list,
+            args.exclude_topics,
+            args.difficulty,
+            args.num_problems,
+            args.problem_type,
+            list_companies(catalog, args.list),
         )
     else:
+        from src.utils.skill_ratings import load_ratings
+
         selected_problems = pick_problems(
-            user_data,
-            all_problems,
-            problem_set,
-            topics,
+            catalog.user_data,
+            # Only needed to build an index, and one is given
+            None,
+            build_problem_mask(catalog, args.list),
+            catalog.topics,
             args.topic_list,
             args.exclude_topics,
             args.difficulty,
             args.num_problems,
+            args.problem_type,
+            index=catalog.index,
+            skip_mask=build_skip_mask(catalog.user_data, catalog.completed),
+            companies=list_companies(catalog, args.list),
+            ratings=load_ratings(catalog) if args.problem_type == "LevelUp" else None,
+        )
+    with stage("output"):
+        print_selection(selected_problems, args)
+
+
+def run_command(args, catalog, session=None):
+    """Runs a non-interactive command, through session if one is kept open"""
+    if args.info:
+        command = info_command
+    elif args.search:
+        command = search_command
+    elif args.stats:
+        command = stats_command
+    elif args.due:
+        command = due_command
+    else:
+        command = pick_command
+    command(args, catalog, session)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    with profiled(
+        sys.argv[1:] if argv is None else argv,
+        profile_destination(args.profile),
+        args.profile_dump,
+        args.trace_malloc,
+    ):
+        dispatch(args)
+
+
+def dispatch(args):
+    from src.data.loader import load_catalog
+
+    # Handle command options
+    if args.help_menu:
+        from src.ui.display import show_helper_menu
+
+        show_helper_menu(load_catalog().topics)
+        sys.exit(0)
+
+    if args.compact_marks:
+        print(
+            f"Compacted {load_catalog().storage.compact_marks()} marks into user.json"
         )
-        if not selected_problems:
-            topic_str = ", ".join(args.topic_list)
-            exclude_str = (
-                ", ".join(args.exclude_topics) if args.exclude_topics else "none"
-            )
-            difficulty_str = ", ".join(args.difficulty) if args.difficulty else "any"
-            print(f"No problems found matching all criteria:")
-            print(f"Topics: {topic_str}")
-            print(f"Excluded topics: {exclude_str}")
-            print(f"Difficulty: {difficulty_str}")
-            print(
-                f"This may be because all matching problems have been completed, or due to topic exclusions."
-            )
+        sys.exit(0)
+
+    # Data files are loaded lazily, on first use by the chosen command
+    catalog = load_catalog()
+
+    try:
+        if args.interactive and not (
+            args.info or args.search or args.stats or args.due
+        ):
+            from src.ui.interactive import interactive_mode
+            from src.utils.picker_session import PickerSession
+            from src.utils.problem_picker import build_problem_mask, list_companies
+
+            if args.topic_list is None:
+                args.topic_list = list(catalog.topics)
+            with stage("session"):
+                session = PickerSession(
+                    catalog, args.problem_type, list_companies(catalog, args.list)
+                )
+            interactive_mode(session, build_problem_mask(catalog, args.list), args)
         else:
-            print(selected_problems)
+            run_command(args, catalog)
+    except ValueError as e:
+        # Raised for unknown problems and --list windows a company does not have
+        sys.exit(str(e))
 
 
 if __name__ == "__main__":
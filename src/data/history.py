@@ -0,0 +1,431 @@
+import argparse
+import hashlib
+import os
+import pickle
+import sys
+from array import array
+from datetime import date
+from src.data.snapshot import get_snapshot_path, write_pickles
+from src.utils.lazy_imports import load_numpy
+
+# Bump whenever the layout of the checkpoint changes
+CHECKPOINT_VERSION = 1
+# Bytes before the checkpointed offset that must be unchanged to trust it
+TAIL_BYTES = 256
+
+
+def _parse_completed_lines(lines, completed):
+    for line in lines:
+        try:
+            if line.strip():  # Skip empty lines
+                completed.add(int(line.split(b",")[0].strip()))
+        except ValueError:
+            continue
+
+
+def _load_checkpoint(checkpoint_path):
+    try:
+        with open(checkpoint_path, "rb") as f:
+            checkpoint = pickle.load(f)
+    except Exception:
+        return None
+    if checkpoint.get("version") != CHECKPOINT_VERSION:
+        return None
+    return checkpoint
+
+
+def _tail_hash(f, offset):
+    start = max(0, offset - TAIL_BYTES)
+    f.seek(start)
+    return hashlib.sha256(f.read(offset - start)).hexdigest()
+
+
+def _checkpoint_matches(f, stat, checkpoint):
+    """True if the file only grew by appends since the checkpoint was taken"""
+    if stat.st_size < checkpoint["size"]:
+        return False
+    if (
+        stat.st_size == checkpoint["size"]
+        and stat.st_mtime_ns != checkpoint["mtime_ns"]
+    ):
+        return False
+    return _tail_hash(f, checkpoint["offset"]) == checkpoint["tail_hash"]
+
+
+def read_completed_ids(csv_path):
+    """
+    Returns the set of problem IDs in completed.csv. The IDs of every complete
+    line are checkpointed in a sidecar file together with their byte offset, so
+    later calls only parse what was appended since. A file that shrank or was
+    edited in place is parsed again from the start.
+    """
+    store = AttemptStore.for_csv(csv_path)
+    if store.exists():
+        state = store.sync(csv_path)
+        completed = set(state["ids"])
+        # Plus a trailing line the store is still waiting on
+        with open(csv_path, "rb") as f:
+            f.seek(state["offset"])
+            _parse_completed_lines(f.read().splitlines(), completed)
+        return completed
+
+    csv_dir, csv_name = os.path.split(csv_path)
+    checkpoint_path = get_snapshot_path(
+        f"{csv_name}.checkpoint", os.path.join(csv_dir, ".cache")
+    )
+    checkpoint = _load_checkpoint(checkpoint_path)
+    stat = os.stat(csv_path)
+
+    with open(csv_path, "rb") as f:
+        if checkpoint and _checkpoint_matches(f, stat, checkpoint):
+            offset = checkpoint["offset"]
+            completed = checkpoint["ids"]
+        else:
+            checkpoint = None
+            offset = 0
+            completed = set()
+        f.seek(offset)
+        appended = f.read()
+
+        # Only whole lines are checkpointed, a trailing partial line is
+        # parsed again next time in case it is still being written
+        end = appended.rfind(b"\n") + 1
+        _parse_completed_lines(appended[:end].splitlines(), completed)
+        offset += end
+        if (
+            checkpoint is None
+            or checkpoint["size"] != stat.st_size
+            or checkpoint["mtime_ns"] != stat.st_mtime_ns
+        ):
+            write_pickles(
+                checkpoint_path,
+                {
+                    "version": CHECKPOINT_VERSION,
+                    "offset": offset,
+                    "tail_hash": _tail_hash(f, offset),
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "ids": completed,
+                },
+            )
+
+    _parse_completed_lines(appended[end:].splitlines(), completed)
+    return completed
+
+
+# Bump whenever the layout of the attempt store changes
+STORE_VERSION = 1
+ATTEMPTS_DIR = "attempts"
+# One little-endian fixed-width file per completed.csv column, -1 where unknown
+ATTEMPT_COLUMNS = [
+    ("id", "<u4"),
+    ("solved", "<i1"),
+    ("errors", "<i4"),
+    ("minutes", "<i4"),
+    ("day", "<i4"),
+]
+_TYPECODES = {"<u4": "I", "<i1": "b", "<i4": "i"}
+_ITEMSIZES = {"<u4": 4, "<i1": 1, "<i4": 4}
+_EPOCH = date(1970, 1, 1).toordinal()
+_SOLVED = {b"yes": 1, b"no": 0}
+# Values the id and the errors/minutes columns can hold
+ID_RANGE = range(2**32)
+INT32_RANGE = range(-(2**31), 2**31)
+
+
+def _to_int(field):
+    try:
+        return int(field)
+    except ValueError:
+        return -1
+
+
+def _parse_attempts(lines, columns, days):
+    """Appends the fields of every parseable line to columns, as ints"""
+    ids, solved, errors, minutes, day_numbers = columns
+    for line in lines:
+        fields = [field.strip() for field in line.split(b",")]
+        try:
+            leetcode_id = int(fields[0])
+        except ValueError:
+            continue
+        fields += [b""] * (5 - len(fields))
+        num_errors = _to_int(fields[2])
+        num_minutes = _to_int(fields[3])
+        # Rows the fixed-width columns cannot hold are skipped like unparseable ones
+        if (
+            leetcode_id not in ID_RANGE
+            or num_errors not in INT32_RANGE
+            or num_minutes not in INT32_RANGE
+        ):
+            continue
+        if fields[4] not in days:
+            try:
+                days[fields[4]] = date.fromisoformat(fields[4].decode()).toordinal()
+                days[fields[4]] -= _EPOCH
+            except (ValueError, UnicodeDecodeError):
+                days[fields[4]] = -1
+        ids.append(leetcode_id)
+        solved.append(_SOLVED.get(fields[1].lower(), -1))
+        errors.append(num_errors)
+        minutes.append(num_minutes)
+        day_numbers.append(days[fields[4]])
+
+
+def _is_complete_attempt(line):
+    """
+    True if a line not yet ended by a newline is a whole attempt. mark_completed
+    starts each row with its newline, so the newest row always looks like this
+    """
+    fields = line.split(b",")
+    return len(fields) >= 5 and len(fields[4].strip()) == len("YYYY-MM-DD")
+
+
+def _complete_end(appended, unterminated=False):
+    """
+    Returns where the whole attempts in appended end, and whether the last of
+    them is still waiting on its newline. If none end in appended, the row
+    before it stays as unterminated as it was.
+    """
+    end = len(appended)
+    last_line = appended[appended.rfind(b"\n") + 1 :]
+    if last_line and not _is_complete_attempt(last_line):
+        end -= len(last_line)
+    if end:
+        unterminated = bool(last_line) and end == len(appended)
+    return end, unterminated
+
+
+def _position(f, stat, offset, unterminated):
+    """Where parsing stopped in f, checked with _read_appended to resume there"""
+    return {
+        "offset": offset,
+        "tail_hash": _tail_hash(f, offset),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "unterminated": unterminated,
+    }
+
+
+def _read_appended(f, stat, position):
+    """
+    Returns the bytes of f after position, or None if f was changed other than
+    by appends since
+    """
+    if not _checkpoint_matches(f, stat, position):
+        return None
+    f.seek(position["offset"])
+    appended = f.read()
+    # Text added straight after a row taken without its newline
+    # changed that row, so it no longer counts as an append
+    if position["unterminated"] and appended[:1] not in b"\r\n":
+        return None
+    return appended
+
+
+class AttemptStore:
+    """
+    A columnar copy of completed.csv: every column is a file of fixed-width
+    integers, so the whole history can be memory-mapped and scanned as arrays.
+    completed.csv stays the source of truth, the store is brought up to date
+    by parsing only what was appended to it since the last sync.
+    """
+
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+        self.state_path = os.path.join(store_dir, "sync.pickle")
+
+    @classmethod
+    def for_csv(cls, csv_path):
+        return cls(os.path.join(os.path.dirname(csv_path), ATTEMPTS_DIR))
+
+    def exists(self):
+        return os.path.isdir(self.store_dir)
+
+    def column_path(self, name):
+        return os.path.join(self.store_dir, f"{name}.bin")
+
+    def __len__(self):
+        rows = []
+        for name, dtype in ATTEMPT_COLUMNS:
+            try:
+                rows.append(
+                    os.path.getsize(self.column_path(name)) // _ITEMSIZES[dtype]
+                )
+            except OSError:
+                rows.append(0)
+        return min(rows)
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, "rb") as f:
+                state = pickle.load(f)
+        except Exception:
+            return None
+        if state.get("version") != STORE_VERSION or state["rows"] != len(self):
+            # Interrupted or concurrent appends: rebuild from the CSV
+            return None
+        return state
+
+    def _append(self, columns, truncate=False):
+        os.makedirs(self.store_dir, exist_ok=True)
+        for (name, dtype), values in zip(ATTEMPT_COLUMNS, columns):
+            data = array(_TYPECODES[dtype], values)
+            if sys.byteorder != "little":
+                data.byteswap()
+            with open(self.column_path(name), "wb" if truncate else "ab") as f:
+                data.tofile(f)
+
+    def sync(self, csv_path):
+        """Brings the store up to date with csv_path and returns its sync state"""
+        state = self._load_state()
+        stat = os.stat(csv_path)
+        if (
+            state
+            and state["size"] == stat.st_size
+            and state["mtime_ns"] == stat.st_mtime_ns
+        ):
+            return state
+
+        with open(csv_path, "rb") as f:
+            appended = _read_appended(f, stat, state) if state else None
+            if appended is None:
+                state = {"offset": 0, "ids": set(), "rows": 0}
+                f.seek(0)
+                appended = f.read()
+            end, unterminated = _complete_end(
+                appended, state.get("unterminated", False)
+            )
+            columns = ([], [], [], [], [])
+            _parse_attempts(appended[:end].splitlines(), columns, {})
+            self._append(columns, truncate=state["offset"] == 0)
+            state = {
+                "version": STORE_VERSION,
+                **_position(f, stat, state["offset"] + end, unterminated),
+                "rows": state["rows"] + len(columns[0]),
+                "ids": state["ids"].union(columns[0]),
+            }
+        write_pickles(self.state_path, state)
+        return state
+
+    def columns(self):
+        """
+        Returns column name -> array of every synced attempt: read-only
+        numpy memmaps when numpy is installed, array.arrays otherwise
+        """
+        numpy = load_numpy()
+        rows = len(self)
+        columns = {}
+        for name, dtype in ATTEMPT_COLUMNS:
+            path = self.column_path(name)
+            if numpy is not None:
+                columns[name] = (
+                    numpy.memmap(path, dtype=dtype, mode="r", shape=(rows,))
+                    if rows
+                    else numpy.empty(0, dtype=dtype)
+                )
+                continue
+            data = array(_TYPECODES[dtype])
+            with open(path, "rb") as f:
+                data.fromfile(f, rows)
+            if sys.byteorder != "little":
+                data.byteswap()
+            columns[name] = data
+        return columns
+
+
+def attempt_columns(columns):
+    """Wraps lists of column values the way AttemptStore.columns() returns them"""
+    numpy = load_numpy()
+    return {
+        name: (
+            numpy.asarray(values, dtype=dtype)
+            if numpy is not None
+            else array(_TYPECODES[dtype], values)
+        )
+        for (name, dtype), values in zip(ATTEMPT_COLUMNS, columns)
+    }
+
+
+def read_attempts(csv_path):
+    """
+    Returns every attempt in csv_path as columns (see AttemptStore.columns),
+    from the columnar store when there is one, else by parsing the CSV
+    """
+    store = AttemptStore.for_csv(csv_path)
+    if store.exists():
+        store.sync(csv_path)
+        return store.columns()
+    columns = ([], [], [], [], [])
+    if os.path.exists(csv_path):
+        with open(csv_path, "rb") as f:
+            _parse_attempts(f.read().splitlines(), columns, {})
+    return attempt_columns(columns)
+
+
+def read_attempts_since(csv_path, position=None):
+    """
+    Returns (columns, position, full): the attempts appended to csv_path since
+    position, a position an earlier call returned, and the position to pass
+    next time. Only the appended bytes are parsed. Without a position, or if
+    csv_path was rewritten since it was taken, columns hold every attempt and
+    full is True.
+    """
+    columns = ([], [], [], [], [])
+    if not os.path.exists(csv_path):
+        return attempt_columns(columns), None, True
+    with open(csv_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        appended = _read_appended(f, stat, position) if position else None
+        full = appended is None
+        if full:
+            position = {"offset": 0, "unterminated": False}
+            f.seek(0)
+            appended = f.read()
+        end, unterminated = _complete_end(appended, position["unterminated"])
+        _parse_attempts(appended[:end].splitlines(), columns, {})
+        position = _position(f, stat, position["offset"] + end, unterminated)
+    return attempt_columns(columns), position, full
+
+
+def attempts_end(csv_path):
+    """
+    Returns the position (see read_attempts_since) after the last attempt in
+    csv_path, reading only its last line
+    """
+    if not os.path.exists(csv_path):
+        return None
+    with open(csv_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        start = max(0, stat.st_size - TAIL_BYTES)
+        f.seek(start)
+        end, unterminated = _complete_end(f.read())
+        return _position(f, stat, start + end, unterminated)
+
+
+def convert(csv_path):
+    """Creates the columnar store for csv_path, or rebuilds it"""
+    store = AttemptStore.for_csv(csv_path)
+    if os.path.exists(store.state_path):
+        os.remove(store.state_path)
+    return store.sync(csv_path)["rows"]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert completed.csv into a columnar, memory-mappable store"
+    )
+    parser.add_argument(
+        "csv_path",
+        nargs="?",
+        default=os.path.join("data", "completed.csv"),
+        help="completed.csv to convert (default: data/completed.csv)",
+    )
+    args = parser.parse_args()
+    rows = convert(args.csv_path)
+    store_dir = AttemptStore.for_csv(args.csv_path).store_dir
+    print(f"Wrote {rows} attempts to {store_dir}, kept in sync from now on")
+
+
+if __name__ == "__main__":
+    main()
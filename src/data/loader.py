@@ -1,42 +1,250 @@
 import json
 import os
+from functools import cached_property
+from src.data.history import (
+    attempts_end,
+    read_attempts,
+    read_attempts_since,
+    read_completed_ids,
+)
+from src.data.snapshot import load_snapshot
+from src.utils.profiling import stage
+from src.utils import problem_tracker
+from src.utils.problem_tracker import (
+    COMPACT_THRESHOLD,
+    apply_marks,
+    compact_marks,
+    load_marks,
+)
 
+# When this file exists in a user directory, it is used instead of the files
+DATABASE = "lcpp.db"
 
-def get_data_path(filename):
+
+def get_data_path(filename, data_dir="data"):
     """Returns the absolute path to a data file"""
     if filename.startswith("data/"):
         return filename
-    return os.path.join("data", filename)
+    return os.path.join(data_dir, filename)
 
 
-def load_json(filename):
-    with open(get_data_path(filename)) as json_file:
+def parse_json(path):
+    with open(path) as json_file:
         return json.load(json_file)
 
 
-def load_user_data():
-    return load_json("user.json")
+def load_json(filename):
+    """Loads a data file through its compiled snapshot, re-parsing only on change"""
+    path = get_data_path(filename)
+    data_dir, name = os.path.split(path)
+    with stage(f"load_json:{name}"):
+        return load_snapshot(
+            name,
+            [path],
+            lambda: parse_json(path),
+            cache_dir=os.path.join(data_dir, ".cache"),
+        )
+
 
+def load_user_data(data_dir="data"):
+    """Loads user.json with the marks journal folded in"""
+    user_data = load_json(get_data_path("user.json", data_dir))
+    marks = load_marks(data_dir)
+    if len(marks) >= COMPACT_THRESHOLD:
+        # Left to whichever process is already compacting, if any
+        compact_marks(data_dir, wait=False)
+    return apply_marks(user_data, marks)
+
+
+def load_topics():
+    """Loads topic -> problem IDs, with every alias sharing its topic's list"""
+    data = load_json("topics.json")
+    topics = dict(data["topics"])
+    for alias, topic in data["aliases"].items():
+        topics[alias] = topics[topic]
+    return topics
+
+
+class FileStorage:
+    """
+    The JSON/CSV files in data/: the catalog files are shared, user.json,
+    completed.csv and the marks journal come from user_dir.
+    """
+
+    def __init__(self, user_dir="data"):
+        self.user_dir = user_dir
+
+    def load_all_problems(self):
+        return load_json("all_problems.json")
+
+    def load_company_to_problems(self):
+        return load_json("company_to_problems.json")
+
+    def load_problem_to_companies(self):
+        return load_json("problem_to_companies.json")
+
+    def load_topics(self):
+        return load_topics()
+
+    def load_index(self, build, name="problem_index"):
+        """Returns build(), rebuilt only when a catalog file changes"""
+        sources = [
+            get_data_path("all_problems.json"),
+            get_data_path("company_to_problems.json"),
+            get_data_path("topics.json"),
+        ]
+        return load_snapshot(name, sources, build)
+
+    def load_user_data(self):
+        return load_user_data(self.user_dir)
+
+    def load_completed(self, user_data):
+        return load_completed_list(user_data, self.user_dir)
+
+    def load_attempts(self):
+        return read_attempts(get_data_path("completed.csv", self.user_dir))
+
+    def load_attempts_since(self, position=None):
+        return read_attempts_since(
+            get_data_path("completed.csv", self.user_dir), position
+        )
+
+    def attempts_end(self):
+        return attempts_end(get_data_path("completed.csv", self.user_dir))
+
+    def mark_completed(self, leetcode_id, was_solved, num_errs, time):
+        problem_tracker.mark_completed(
+            leetcode_id, was_solved, num_errs, time, self.user_dir
+        )
+
+    def mark_problem(self, user_data, mark_type, leetcode_id):
+        problem_tracker.mark_problem(user_data, mark_type, leetcode_id, self.user_dir)
+
+    def compact_marks(self):
+        return compact_marks(self.user_dir)
 
-def load_all_data():
-    user_data = load_user_data()
-    problem_to_companies = load_json("problem_to_companies.json")
-    company_to_problems = load_json("company_to_problems.json")
-    all_problems = load_json("all_problems.json")
-    my_companies = set(user_data["faang"] + user_data["my_companies"])
 
+def open_storage(user_dir="data"):
+    """Returns the SQLite storage if user_dir has a database, else the files"""
+    db_path = get_data_path(DATABASE, user_dir)
+    if os.path.exists(db_path):
+        from src.data.sqlite_store import SQLiteStorage
+
+        return SQLiteStorage(db_path)
+    return FileStorage(user_dir)
+
+
+class Catalog:
+    """
+    All data, each part loaded on first access so a command only pays for what
+    it uses. User files (user.json, completed.csv, marks) come from user_dir,
+    which lets several profiles share one catalog. Everything is read through
+    user_dir's storage: the data files, or its SQLite database if it has one.
+    """
+
+    # Properties that depend only on the shared catalog files
+    SHARED = [
+        "problem_to_companies",
+        "company_to_problems",
+        "all_problems",
+        "topics",
+        "index",
+        "name_index",
+    ]
+
+    def __init__(self, user_dir="data"):
+        self.user_dir = user_dir
+        self.storage = open_storage(user_dir)
+
+    def for_user(self, user_dir):
+        """Returns a catalog for another user's files, reusing what this one has loaded"""
+        catalog = Catalog(user_dir)
+        for name in self.SHARED:
+            if name in self.__dict__:
+                catalog.__dict__[name] = self.__dict__[name]
+        return catalog
+
+    @cached_property
+    def user_data(self):
+        return self.storage.load_user_data()
+
+    @cached_property
+    def completed(self):
+        with stage("load_completed_list"):
+            return self.storage.load_completed(self.user_data)
+
+    @cached_property
+    def problem_to_companies(self):
+        return self.storage.load_problem_to_companies()
+
+    @cached_property
+    def company_to_problems(self):
+        return self.storage.load_company_to_problems()
+
+    @cached_property
+    def all_problems(self):
+        return self.storage.load_all_problems()
+
+    @cached_property
+    def my_companies(self):
+        return set(self.user_data["faang"] + self.user_data["my_companies"])
+
+    @cached_property
+    def topics(self):
+        return self.storage.load_topics()
+
+    @cached_property
+    def index(self):
+        """Bitmask index over the catalog, rebuilt only when the catalog changes"""
+        from src.utils.problem_index import ProblemIndex
+
+        with stage("index"):
+            return self.storage.load_index(
+                lambda: ProblemIndex(
+                    self.all_problems, self.topics, self.company_to_problems
+                )
+            )
+
+    @cached_property
+    def name_index(self):
+        """Trigram index over problem names, snapshotted like the bitmask index"""
+        from src.utils.name_search import NameIndex
+
+        with stage("name_index"):
+            return self.storage.load_index(
+                lambda: NameIndex(self.all_problems), "name_index"
+            )
+
+    def find_problem(self, text):
+        """Resolves a problem ID or (part of) a name to a problem ID"""
+        if text.strip().isdigit():
+            leetcode_id = int(text)
+            if str(leetcode_id) not in self.all_problems:
+                raise ValueError(f"Unknown problem ID: {leetcode_id}")
+            return leetcode_id
+        leetcode_id = self.name_index.find(text)
+        if leetcode_id is None:
+            raise ValueError(f"No problem name matches: {text}")
+        return leetcode_id
+
+
+def load_catalog(user_dir="data"):
+    return Catalog(user_dir)
+
+
+def load_all_data():
+    catalog = load_catalog()
     return (
-        user_data,
-        problem_to_companies,
-        company_to_problems,
-        all_problems,
-        my_companies,
+        catalog.user_data,
+        catalog.problem_to_companies,
+        catalog.company_to_problems,
+        catalog.all_problems,
+        catalog.my_companies,
     )
 
 
-def load_completed_list(user_data):
-    completed1 = set()
-    csv_path = get_data_path("completed.csv")
+def load_completed_list(user_data, data_dir="data"):
+    csv_path = get_data_path("completed.csv", data_dir)
 
     # Check if file exists, create if it doesn't
     if not os.path.exists(csv_path):
@@ -46,14 +254,8 @@ def load_completed_list(user_data):
         with open(csv_path, "w") as f:
             pass
 
-    # Read from existing file
-    with open(csv_path, "r") as f:
-        for line in f.read().splitlines():
-            try:
-                if line.strip():  # Skip empty lines
-                    completed1.add(int(line.split(",")[0].strip()))
-            except ValueError:
-                continue
+    # Read from existing file, only parsing lines appended since the last run
+    completed1 = read_completed_ids(csv_path)
 
     # Add problems from user data if available
     completed2 = set(user_data.get("completed", []))
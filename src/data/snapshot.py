@@ -0,0 +1,82 @@
+import hashlib
+import os
+import pickle
+
+# Bump whenever the layout of a snapshot payload changes
+SNAPSHOT_VERSION = 7
+CACHE_DIR = os.path.join("data", ".cache")
+
+
+def get_snapshot_path(name, cache_dir=CACHE_DIR):
+    """Returns the path of the compiled snapshot called name"""
+    return os.path.join(cache_dir, f"{name}.pickle")
+
+
+def _stat_key(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _content_hash(paths):
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_pickles(path, *objects):
+    """Atomically writes objects to path as consecutive pickles"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            for obj in objects:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        # A read-only checkout still works, it just never gets faster
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def load_snapshot(name, sources, build, cache_dir=CACHE_DIR):
+    """
+    Returns build(), reusing a pickled copy of its result for as long as the
+    source files are unchanged. Sources are compared by mtime/size first and
+    only re-hashed when those differ, so a touched but identical file does not
+    force a rebuild.
+    """
+    snapshot_path = get_snapshot_path(name, cache_dir)
+    stats = [_stat_key(path) for path in sources]
+    digest = None
+
+    try:
+        with open(snapshot_path, "rb") as f:
+            header = pickle.load(f)
+            same_sources = header.get("sources") == list(sources)
+            if header.get("version") == SNAPSHOT_VERSION and same_sources:
+                if header["stats"] == stats:
+                    return pickle.load(f)
+                digest = _content_hash(sources)
+                if header["digest"] == digest:
+                    payload = pickle.load(f)
+                    header["stats"] = stats
+                    write_pickles(snapshot_path, header, payload)
+                    return payload
+    except Exception:
+        # Missing, stale-format or corrupt snapshots are simply rebuilt
+        pass
+
+    if digest is None:
+        digest = _content_hash(sources)
+    payload = build()
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "sources": list(sources),
+        "stats": stats,
+        "digest": digest,
+    }
+    write_pickles(snapshot_path, header, payload)
+    return payload
@@ -0,0 +1,495 @@
+import argparse
+import datetime
+import json
+import os
+import pickle
+import sqlite3
+import sys
+from src.data.history import ID_RANGE, INT32_RANGE, attempt_columns
+from src.data.loader import DATABASE, get_data_path, parse_json
+from src.data.snapshot import SNAPSHOT_VERSION
+from src.utils.problem_picker import build_skip_mask
+from src.utils.problem_tracker import apply_marks, read_marks
+
+# Fields of an all_problems.json entry that get their own column
+PROBLEM_FIELDS = ["Acceptance", "Difficulty", "Frequency", "Link", "Name"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS problems (
+    id INTEGER PRIMARY KEY,
+    acceptance TEXT,
+    difficulty TEXT,
+    frequency TEXT,
+    link TEXT,
+    name TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS problems_by_difficulty ON problems (difficulty, id);
+CREATE TABLE IF NOT EXISTS company_problems (
+    company TEXT NOT NULL,
+    duration TEXT NOT NULL,
+    problem_id INTEGER NOT NULL,
+    frequency TEXT
+);
+CREATE INDEX IF NOT EXISTS company_problems_by_company
+    ON company_problems (company, duration, problem_id);
+CREATE INDEX IF NOT EXISTS company_problems_by_problem
+    ON company_problems (problem_id);
+CREATE TABLE IF NOT EXISTS problem_companies (
+    problem_id INTEGER NOT NULL,
+    company TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS problem_companies_by_problem
+    ON problem_companies (problem_id);
+CREATE TABLE IF NOT EXISTS topics (
+    topic TEXT NOT NULL,
+    problem_id INTEGER NOT NULL,
+    PRIMARY KEY (topic, problem_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS topics_by_problem ON topics (problem_id);
+CREATE TABLE IF NOT EXISTS topic_aliases (alias TEXT PRIMARY KEY, topic TEXT);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    problem_id INTEGER NOT NULL,
+    was_solved TEXT,
+    num_errs TEXT,
+    time TEXT,
+    date TEXT
+);
+CREATE INDEX IF NOT EXISTS attempts_by_problem ON attempts (problem_id, was_solved);
+CREATE TABLE IF NOT EXISTS marks (
+    id INTEGER PRIMARY KEY,
+    type TEXT NOT NULL,
+    problem_id INTEGER NOT NULL,
+    date TEXT
+);
+CREATE INDEX IF NOT EXISTS marks_by_type ON marks (type, problem_id);
+CREATE TABLE IF NOT EXISTS snapshots (
+    name TEXT PRIMARY KEY,
+    catalog_version INTEGER,
+    payload BLOB
+);
+"""
+
+
+def connect(path):
+    connection = sqlite3.connect(path)
+    # Readers never block the single writer, and appends are one small commit
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _rows_by_rowid(connection, query, params=()):
+    return connection.execute(f"{query} ORDER BY rowid", params)
+
+
+def _meta(connection, key, default=None):
+    row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else default
+
+
+class SQLiteStorage:
+    """
+    Catalog and practice history kept in one SQLite database, read and written
+    with indexed queries instead of whole-file parses and rewrites. Loading
+    returns the same shapes as the JSON files, so the picker works unchanged.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = connect(path)
+
+    def catalog_version(self):
+        return int(_meta(self.connection, "catalog_version", 0))
+
+    def load_all_problems(self):
+        all_problems = {}
+        for row in self.connection.execute(
+            "SELECT id, acceptance, difficulty, frequency, link, name, extra "
+            "FROM problems ORDER BY rowid"
+        ):
+            problem = dict(zip(PROBLEM_FIELDS, row[1:6]))
+            if row[6]:
+                problem.update(json.loads(row[6]))
+            all_problems[str(row[0])] = problem
+        return all_problems
+
+    def load_company_to_problems(self):
+        company_to_problems = {}
+        for company, duration, problem_id, frequency in _rows_by_rowid(
+            self.connection,
+            "SELECT company, duration, problem_id, frequency FROM company_problems",
+        ):
+            durations = company_to_problems.setdefault(company, {})
+            durations.setdefault(duration, {})[str(problem_id)] = frequency
+        return company_to_problems
+
+    def load_problem_to_companies(self):
+        problem_to_companies = {}
+        for problem_id, company in _rows_by_rowid(
+            self.connection, "SELECT problem_id, company FROM problem_companies"
+        ):
+            problem_to_companies.setdefault(str(problem_id), []).append(company)
+        return problem_to_companies
+
+    def load_topics(self):
+        topics = {}
+        for topic, problem_id in self.connection.execute(
+            "SELECT topic, problem_id FROM topics"
+        ):
+            topics.setdefault(topic, []).append(problem_id)
+        for alias, topic in self.connection.execute(
+            "SELECT alias, topic FROM topic_aliases"
+        ):
+            topics[alias] = topics.setdefault(topic, [])
+        return topics
+
+    def load_index(self, build, name="problem_index"):
+        """
+        Returns build(), reusing the copy pickled into the database for as long
+        as the catalog has not been re-imported
+        """
+        catalog_version = self.catalog_version()
+        row = self.connection.execute(
+            "SELECT catalog_version, payload FROM snapshots WHERE name = ?",
+            (f"{name}-{SNAPSHOT_VERSION}",),
+        ).fetchone()
+        if row and row[0] == catalog_version:
+            try:
+                return pickle.loads(row[1])
+            except Exception:
+                # A corrupt snapshot is simply rebuilt
+                pass
+        index = build()
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?)",
+                (
+                    f"{name}-{SNAPSHOT_VERSION}",
+                    catalog_version,
+                    pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL),
+                ),
+            )
+        return index
+
+    def load_user_data(self):
+        user_data = json.loads(_meta(self.connection, "user_data", "{}"))
+        marks = self.connection.execute(
+            "SELECT type, problem_id FROM marks ORDER BY id"
+        ).fetchall()
+        return apply_marks(user_data, marks)
+
+    def load_completed(self, user_data):
+        completed = {
+            problem_id
+            for (problem_id,) in self.connection.execute(
+                "SELECT DISTINCT problem_id FROM attempts"
+            )
+        }
+        return completed.union(user_data.get("completed", []))
+
+    def load_attempts(self):
+        """Every attempt as columns, with the CSV fields converted in SQL"""
+        return self.load_attempts_since()[0]
+
+    def load_attempts_since(self, position=None):
+        """
+        Like read_attempts_since: the attempts added since position, the
+        position to pass next time, and whether they are every attempt. A
+        position is the last attempt's row ID and the number of rows up to it,
+        so a re-import or deleted rows replay the whole history.
+        """
+        version = self.catalog_version()
+        full = not (
+            position
+            and position["catalog_version"] == version
+            and position["rows"]
+            == self.connection.execute(
+                "SELECT COUNT(*) FROM attempts WHERE id <= ?", (position["id"],)
+            ).fetchone()[0]
+        )
+        after = {"id": 0, "rows": 0} if full else position
+        rows = self.connection.execute(
+            """
+            SELECT
+                id,
+                problem_id,
+                CASE lower(was_solved) WHEN 'yes' THEN 1 WHEN 'no' THEN 0 ELSE -1 END,
+                CASE WHEN num_errs GLOB '[0-9]*' THEN CAST(num_errs AS INTEGER)
+                    ELSE -1 END,
+                CASE WHEN time GLOB '[0-9]*' THEN CAST(time AS INTEGER) ELSE -1 END,
+                COALESCE(CAST(julianday(date) - julianday('1970-01-01') AS INTEGER), -1)
+            FROM attempts WHERE id > ? ORDER BY id
+            """,
+            (after["id"],),
+        ).fetchall()
+        position = {
+            "catalog_version": version,
+            "id": rows[-1][0] if rows else after["id"],
+            "rows": after["rows"] + len(rows),
+        }
+        # The same rows the attempt store skips, which its columns cannot hold
+        rows = [
+            row[1:]
+            for row in rows
+            if row[1] in ID_RANGE and row[3] in INT32_RANGE and row[4] in INT32_RANGE
+        ]
+        return attempt_columns(list(zip(*rows)) or ([], [], [], [], [])), position, full
+
+    def attempts_end(self):
+        """The position (see load_attempts_since) after the last attempt"""
+        rows, last_id = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM attempts"
+        ).fetchone()
+        return {"catalog_version": self.catalog_version(), "id": last_id, "rows": rows}
+
+    def mark_completed(self, leetcode_id, was_solved, num_errs, time):
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO attempts (problem_id, was_solved, num_errs, time, date) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (leetcode_id, was_solved, num_errs, time, f"{datetime.date.today()}"),
+            )
+
+    def mark_problem(self, user_data, mark_type, leetcode_id):
+        user_data.setdefault(mark_type, []).append(leetcode_id)
+        with self.connection:
+            self.connection.execute(
+                "INSERT INTO marks (type, problem_id, date) VALUES (?, ?, ?)",
+                (mark_type, leetcode_id, f"{datetime.date.today()}"),
+            )
+
+    def compact_marks(self):
+        """Marks are already indexed rows, so there is no journal to fold"""
+        return 0
+
+    def find_problems(
+        self, difficulty=None, topic=None, company=None, duration=None, unsolved=False
+    ):
+        """
+        Returns the IDs of problems matching every given filter, e.g. unsolved
+        Hard graph problems asked by google in the last 6 months. Each filter
+        is one indexed lookup. unsolved keeps only the problems the picker
+        would still offer: never attempted, not in user.json's completed list
+        and not marked hard, revisit or refresh.
+        """
+        if topic is not None:
+            row = self.connection.execute(
+                "SELECT topic FROM topic_aliases WHERE alias = ?", (topic,)
+            ).fetchone()
+            topic = row[0] if row else topic
+
+        joins, conditions, params = [], [], []
+        if topic is not None:
+            joins.append("JOIN topics t ON t.problem_id = p.id AND t.topic = ?")
+            params.append(topic)
+        if company is not None:
+            joins.append(
+                "JOIN (SELECT DISTINCT problem_id FROM company_problems "
+                "WHERE company = ?"
+                + (" AND duration = ?" if duration is not None else "")
+                + ") c ON c.problem_id = p.id"
+            )
+            params.append(company)
+            if duration is not None:
+                params.append(duration)
+        if difficulty is not None:
+            conditions.append("p.difficulty = ?")
+            params.append(difficulty)
+        if unsolved:
+            conditions.append(
+                "NOT EXISTS (SELECT 1 FROM attempts a WHERE a.problem_id = p.id)"
+            )
+        query = " ".join(
+            ["SELECT p.id FROM problems p"]
+            + joins
+            + (["WHERE " + " AND ".join(conditions)] if conditions else [])
+            + ["ORDER BY p.id"]
+        )
+        problem_ids = [
+            problem_id for (problem_id,) in self.connection.execute(query, params)
+        ]
+        if unsolved:
+            # The rest of the picker's skip rule lives in user_data
+            user_data = self.load_user_data()
+            skip_mask = build_skip_mask(user_data, self.load_completed(user_data))
+            problem_ids = [i for i in problem_ids if not skip_mask >> i & 1]
+        return problem_ids
+
+
+def _read_attempts(csv_path):
+    attempts = []
+    if not os.path.exists(csv_path):
+        return attempts
+    with open(csv_path) as f:
+        for line in f.read().splitlines():
+            fields = [field.strip() for field in line.split(",")]
+            try:
+                problem_id = int(fields[0])
+            except ValueError:
+                continue
+            fields += [None] * (5 - len(fields))
+            attempts.append((problem_id, *fields[1:5]))
+    return attempts
+
+
+def import_files(db_path, data_dir="data", user_dir=None):
+    """
+    Copies the JSON/CSV data files into the database at db_path, replacing
+    whatever it held. The catalog comes from data_dir, user.json,
+    completed.csv and the marks journal from user_dir (default: data_dir).
+    """
+    user_dir = user_dir or data_dir
+    all_problems = parse_json(get_data_path("all_problems.json", data_dir))
+    company_to_problems = parse_json(
+        get_data_path("company_to_problems.json", data_dir)
+    )
+    problem_to_companies = parse_json(
+        get_data_path("problem_to_companies.json", data_dir)
+    )
+    topics = parse_json(get_data_path("topics.json", data_dir))
+    user_data = parse_json(get_data_path("user.json", user_dir))
+    attempts = _read_attempts(get_data_path("completed.csv", user_dir))
+    marks = read_marks(get_data_path("marks.csv", user_dir))
+
+    connection = connect(db_path)
+    catalog_version = int(_meta(connection, "catalog_version", 0))
+    with connection:
+        for table in [
+            "problems",
+            "company_problems",
+            "problem_companies",
+            "topics",
+            "topic_aliases",
+            "attempts",
+            "marks",
+            "snapshots",
+        ]:
+            connection.execute(f"DELETE FROM {table}")
+        connection.executemany(
+            "INSERT INTO problems VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    int(key),
+                    *(problem.get(field) for field in PROBLEM_FIELDS),
+                    (
+                        json.dumps(
+                            {
+                                k: v
+                                for k, v in problem.items()
+                                if k not in PROBLEM_FIELDS
+                            }
+                        )
+                        if set(problem) - set(PROBLEM_FIELDS)
+                        else None
+                    ),
+                )
+                for key, problem in all_problems.items()
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO company_problems VALUES (?, ?, ?, ?)",
+            (
+                (company, duration, int(key), frequency)
+                for company, durations in company_to_problems.items()
+                for duration, problems in durations.items()
+                for key, frequency in problems.items()
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO problem_companies VALUES (?, ?)",
+            (
+                (int(key), company)
+                for key, companies in problem_to_companies.items()
+                for company in companies
+            ),
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO topics VALUES (?, ?)",
+            (
+                (topic, problem_id)
+                for topic, problem_ids in topics["topics"].items()
+                for problem_id in problem_ids
+            ),
+        )
+        connection.executemany(
+            "INSERT INTO topic_aliases VALUES (?, ?)", topics["aliases"].items()
+        )
+        connection.executemany(
+            "INSERT INTO attempts (problem_id, was_solved, num_errs, time, date) "
+            "VALUES (?, ?, ?, ?, ?)",
+            attempts,
+        )
+        connection.executemany(
+            "INSERT INTO marks (type, problem_id) VALUES (?, ?)", marks
+        )
+        connection.executemany(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+            [
+                ("user_data", json.dumps(user_data)),
+                ("catalog_version", str(catalog_version + 1)),
+            ],
+        )
+    connection.close()
+    return len(all_problems), len(attempts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the SQLite storage backend")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = subparsers.add_parser(
+        "import", help="Copy the JSON/CSV data files into the database"
+    )
+    import_parser.add_argument("--data-dir", default="data", help="Catalog directory")
+    import_parser.add_argument(
+        "--user-dir", help="Directory with user.json and completed.csv"
+    )
+    import_parser.add_argument(
+        "--force", action="store_true", help="Overwrite an existing database"
+    )
+
+    query_parser = subparsers.add_parser(
+        "query", help="List problems matching every given filter"
+    )
+    query_parser.add_argument("--difficulty", "-d", choices=["Easy", "Medium", "Hard"])
+    query_parser.add_argument("--topic", "-t", help="Topic or topic alias")
+    query_parser.add_argument("--company", "-c", help="Company asking the problem")
+    query_parser.add_argument(
+        "--duration",
+        choices=["6months", "1year", "2year", "alltime"],
+        help="How recently the company asked it",
+    )
+    query_parser.add_argument(
+        "--unsolved",
+        action="store_true",
+        help="Only problems the picker can still offer (not attempted, completed or marked)",
+    )
+    for subparser in [import_parser, query_parser]:
+        subparser.add_argument(
+            "--db", help=f"Database path (default: <user dir or data dir>/{DATABASE})"
+        )
+    args = parser.parse_args()
+
+    if args.command == "import":
+        db_path = args.db or os.path.join(args.user_dir or args.data_dir, DATABASE)
+        if os.path.exists(db_path) and not args.force:
+            print(f"{db_path} already exists, pass --force to replace its contents")
+            sys.exit(1)
+        num_problems, num_attempts = import_files(db_path, args.data_dir, args.user_dir)
+        print(f"Imported {num_problems} problems and {num_attempts} attempts")
+        print(f"into {db_path}; lcpp now reads and writes it instead of the files")
+    else:
+        storage = SQLiteStorage(args.db or os.path.join("data", DATABASE))
+        print(
+            storage.find_problems(
+                args.difficulty, args.topic, args.company, args.duration, args.unsolved
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
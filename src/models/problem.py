@@ -1,3 +1,14 @@
 from enum import Enum
 
-ProblemType = Enum("ProblemType", "Top Freq Easiest Hardest Common Random")
+ProblemType = Enum(
+    "ProblemType", "Top Freq Easiest Hardest Common Random Weighted LevelUp"
+)
+
+# ProblemType names pick_problems knows how to select
+SUPPORTED_PROBLEM_TYPES = [
+    ProblemType.Random.name,
+    ProblemType.Top.name,
+    ProblemType.Weighted.name,
+    ProblemType.LevelUp.name,
+    ProblemType.Common.name,
+]
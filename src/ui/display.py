@@ -23,6 +23,16 @@ def print_info(all_problems, problem_to_companies, my_companies, leetcode_id):
     )
 
 
+def print_matches(all_problems, matches):
+    if not matches:
+        print("No problem names match")
+    for leetcode_id, similarity in matches:
+        problem = all_problems[str(leetcode_id)]
+        print(
+            f"{leetcode_id:>5} {problem['Name']} ({problem['Difficulty']}, {similarity:.0%} match)"
+        )
+
+
 def show_helper_menu(topics):
     """Interactive helper menu to guide users in building their command"""
     print("\n===== LeetCode Problem Picker Helper Menu =====\n")
@@ -167,3 +177,41 @@ def show_helper_menu(topics):
         "num_problems": num_problems,
         "interactive": interactive,
     }
+
+
+def _format_rate(value):
+    return "-" if value is None else f"{value:.0%}"
+
+
+def _format_number(value, digits=1):
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def print_stats(stats):
+    """Prints the tables computed by progress_stats"""
+    overall = stats["overall"]
+    print(
+        f"Solved {overall['completed']} of {overall['problems']} problems "
+        f"({_format_rate(overall['completion_rate'])}) in {overall['attempts']} attempts"
+    )
+    header = (
+        f"{'':<28} {'Solved':>13} {'Rate':>5} {'Attempts':>9} "
+        f"{'Success':>7} {'Errors':>7} {'Median min':>11}"
+    )
+    for title, rows in [("Difficulty", stats["difficulty"]), ("Topic", stats["topic"])]:
+        print(f"\n{title}{header[len(title):]}")
+        for name, row in rows.items():
+            completed = f"{row['completed']}/{row['problems']}"
+            print(
+                f"{name[:28]:<28} {completed:>13} {_format_rate(row['completion_rate']):>5} "
+                f"{row['attempts']:>9} {_format_rate(row['solve_rate']):>7} "
+                f"{_format_number(row['errors_per_attempt'], 2):>7} "
+                f"{_format_number(row['median_minutes']):>11}"
+            )
+
+    if stats["weekly"]:
+        print("\nWeek of       Attempts  Solved")
+        most = max(attempts for _, attempts, _ in stats["weekly"]) or 1
+        for week_start, attempts, solved in stats["weekly"]:
+            bar = "#" * round(30 * attempts / most)
+            print(f"{week_start:%Y-%m-%d} {attempts:>11} {solved:>7}  {bar}")
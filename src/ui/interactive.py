@@ -1,29 +1,23 @@
+from itertools import zip_longest
 from timeit import default_timer as timer
-from src.utils.problem_tracker import mark_completed, mark_problem
-from src.utils.problem_picker import pick_problems
+from src.utils.problem_index import mask_of, popcount
 from src.ui.display import print_info
+from src.utils.review_scheduler import day_to_date
 
 
-def interactive_mode(
-    user_data,
-    problem_set,
-    args,
-    all_problems,
-    problem_to_companies,
-    my_companies,
-    topics,
-):
-    problems = pick_problems(
-        user_data=user_data,
-        all_problems=all_problems,
-        problems=problem_set,
-        topics=topics,
+def interactive_mode(session, problem_mask, args):
+    catalog = session.catalog
+    index = session.index
+    topics = catalog.topics
+
+    problems = session.pick(
+        problems=problem_mask,
         topic_list=args.topic_list,
         exclude_topics=args.exclude_topics,
         difficulty_list=args.difficulty,
         k=args.num_problems,
     )
-    problem_set -= set(problems)
+    problem_mask &= ~mask_of(problems)
 
     if len(problems) == 0:
         topic_str = ", ".join(args.topic_list)
@@ -37,22 +31,13 @@ def interactive_mode(
         # Check for any uncompleted problems in the selected topic
         print("\nChecking for any uncompleted problems in your selected topics...")
 
-        # Get all problems for selected topic
-        all_topic_problems = set()
-        for topic in args.topic_list:
-            all_topic_problems.update(topics.get(topic, []))
-
-        # Load the completed problems
-        from src.data.loader import load_completed_list
-
-        completed = set(load_completed_list(user_data))
-
-        # Find non-completed problems for this topic
-        remaining_topic_problems = all_topic_problems - completed
+        # Find non-completed problems for the selected topics
+        completed_mask = mask_of(session.completed)
+        remaining_topic_problems = index.topic_mask(args.topic_list) & ~completed_mask
 
         if remaining_topic_problems:
             print(
-                f"Found {len(remaining_topic_problems)} uncompleted problems in your selected topics."
+                f"Found {popcount(remaining_topic_problems)} uncompleted problems in your selected topics."
             )
             print("What would you like to do?")
             print("1. Show uncompleted problems from my topic (ignore other filters)")
@@ -62,11 +47,8 @@ def interactive_mode(
 
             if choice == "1":
                 # Show uncompleted problems from the selected topic(s)
-                problems = pick_problems(
-                    user_data=user_data,
-                    all_problems=all_problems,
+                problems = session.pick(
                     problems=remaining_topic_problems,
-                    topics=topics,
                     topic_list=args.topic_list,
                     exclude_topics=None,  # Ignore exclusions
                     difficulty_list=None,  # Ignore difficulty
@@ -81,11 +63,8 @@ def interactive_mode(
 
             # Try with all problems but keep other filters
             print("\nTrying to find problems from entire problem set...")
-            problems = pick_problems(
-                user_data=user_data,
-                all_problems=all_problems,
-                problems=set(range(1, 1700)),
-                topics=topics,
+            problems = session.pick(
+                problems=index.all_mask,
                 topic_list=args.topic_list,
                 exclude_topics=args.exclude_topics,
                 difficulty_list=args.difficulty,
@@ -96,37 +75,53 @@ def interactive_mode(
                 print(
                     "\nStill no matches. Will try ignoring topic filter and using all topics..."
                 )
-                problems = pick_problems(
-                    user_data=user_data,
-                    all_problems=all_problems,
-                    problems=problem_set,
-                    topics=topics,
+                problems = session.pick(
+                    problems=problem_mask,
                     topic_list=topics.keys(),
                     exclude_topics=args.exclude_topics,
                     difficulty_list=args.difficulty,
                     k=args.num_problems,
                 )
     if len(problems) == 0:
-        problems = pick_problems(
-            user_data=user_data,
-            all_problems=all_problems,
-            problems=set(range(1, 1700)),
-            topics=topics,
+        problems = session.pick(
+            problems=index.all_mask,
             topic_list=topics.keys(),
             exclude_topics=args.exclude_topics,
             difficulty_list=args.difficulty,
             k=args.num_problems,
         )
 
+    # Interleave reviews that are due with the new problems, one before each
+    reviews = session.reviews
+    # Marks made before IDs were checked may name problems not in the catalog
+    due = [
+        i
+        for i in reviews.due(k=len(problems))
+        if i not in problems and str(i) in catalog.all_problems
+    ]
+    if due:
+        print(f"{len(due)} review(s) due, mixed in with the new problems")
+    review_ids = set(due)
+    problems = [
+        leetcode_id
+        for review, new in zip_longest(due, problems)
+        for leetcode_id in (review, new)
+        if leetcode_id is not None
+    ]
+
     valid_inputs = ["info", "hint", "easy", "hard", "quit", "pause", "break"]
     print(f"Other valid inputs: {', '.join(valid_inputs)}")
 
     for idx, leetcode_id in enumerate(problems):
-        problem = all_problems[str(leetcode_id)]
+        problem = catalog.all_problems[str(leetcode_id)]
         msg = (
-            "First problem"
-            if idx == 0
-            else "Last problem" if idx == args.num_problems - 1 else "Next up"
+            f"Review (due {day_to_date(reviews.items[leetcode_id].due)})"
+            if leetcode_id in review_ids
+            else (
+                "First problem"
+                if idx == 0
+                else "Last problem" if idx == len(problems) - 1 else "Next up"
+            )
         )
         print(f"\n{msg}:\n{leetcode_id}: {problem['Name']} {problem['Link']}")
         start_time = timer()
@@ -139,7 +134,10 @@ def interactive_mode(
                 print("Hint feature not implemented yet")
             elif inp == "info":
                 print_info(
-                    all_problems, problem_to_companies, my_companies, leetcode_id
+                    catalog.all_problems,
+                    catalog.problem_to_companies,
+                    catalog.my_companies,
+                    leetcode_id,
                 )
             elif inp == "pause":
                 pause_time = timer()
@@ -149,50 +147,41 @@ def interactive_mode(
                 input("Paused. Press Enter to reset the clock and start the problem\n")
                 start_time = timer()
             elif inp == "easy":
-                mark_completed(leetcode_id, "yes", "0", "5")
+                session.mark_completed(leetcode_id, "yes", "0", "5")
                 # Replace with new problem not in problems
-                new_problems = pick_problems(
-                    user_data=user_data,
-                    all_problems=all_problems,
-                    problems=problem_set,
-                    topics=topics,
+                new_problems = session.pick(
+                    problems=problem_mask,
                     topic_list=args.topic_list,
                     difficulty_list=args.difficulty,
                     k=1,
                 )
                 if new_problems:
                     leetcode_id = new_problems[0]
-                    problem_set.discard(leetcode_id)
-                    problem = all_problems[str(leetcode_id)]
+                    problem_mask &= ~(1 << leetcode_id)
+                    problem = catalog.all_problems[str(leetcode_id)]
                     print(
                         f"\n{msg}:\n{leetcode_id}: {problem['Name']} {problem['Link']}"
                     )
                     start_time = timer()
             elif inp == "hard":
-                mark_problem(user_data, "hard", leetcode_id)
-                new_problems = pick_problems(
-                    user_data=user_data,
-                    all_problems=all_problems,
-                    problems=problem_set,
-                    topics=topics,
+                session.mark_problem("hard", leetcode_id)
+                new_problems = session.pick(
+                    problems=problem_mask,
                     topic_list=args.topic_list,
                     k=1,
                 )
                 if new_problems:
                     leetcode_id = new_problems[0]
-                    problem_set.discard(leetcode_id)
-                    problem = all_problems[str(leetcode_id)]
+                    problem_mask &= ~(1 << leetcode_id)
+                    problem = catalog.all_problems[str(leetcode_id)]
                     print(
                         f"\n{msg}:\n{leetcode_id}: {problem['Name']} {problem['Link']}"
                     )
                     start_time = timer()
             elif inp == "skip":
                 try:
-                    leetcode_id = pick_problems(
-                        user_data=user_data,
-                        all_problems=all_problems,
-                        problems=problem_set,
-                        topics=topics,
+                    leetcode_id = session.pick(
+                        problems=problem_mask,
                         topic_list=args.topic_list,
                         exclude_topics=args.exclude_topics,
                         difficulty_list=args.difficulty,
@@ -201,14 +190,15 @@ def interactive_mode(
                     start_time = timer()
                 except IndexError:
                     break
-            elif inp.startswith("revisit"):
-                parts = inp.split(" ")
-                marked_id = int(parts[1]) if len(parts) > 1 else leetcode_id
-                mark_problem(user_data, "revisit", marked_id)
-            elif inp.startswith("refresh"):
-                parts = inp.split(" ")
-                marked_id = int(parts[1]) if len(parts) > 1 else leetcode_id
-                mark_problem(user_data, "refresh", marked_id)
+            elif inp.startswith("revisit") or inp.startswith("refresh"):
+                mark_type = "revisit" if inp.startswith("revisit") else "refresh"
+                parts = inp.split()
+                marked_id = parts[1].lstrip("0") if len(parts) > 1 else str(leetcode_id)
+                # An unknown ID would be scheduled and crash the next session
+                if marked_id not in catalog.all_problems:
+                    print(f"Unknown problem ID: {parts[1]}")
+                    continue
+                session.mark_problem(mark_type, int(marked_id))
             elif inp.startswith("y") or inp.startswith("n"):
                 entry = inp.split(",")
                 was_solved = "yes" if entry[0].startswith("y") else "no"
@@ -216,7 +206,7 @@ def interactive_mode(
                 true_time = round((timer() - start_time) / 60)
                 time = entry[2] if len(entry) > 2 else true_time
 
-                mark_completed(leetcode_id, was_solved, num_errs, time)
+                session.mark_completed(leetcode_id, was_solved, num_errs, time)
                 print(f"completed in {true_time}min")
                 break
             elif inp == "help":
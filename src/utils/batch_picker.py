@@ -0,0 +1,166 @@
+import argparse
+import json
+import os
+import random
+import sys
+from multiprocessing import Pool
+
+from src.data.loader import load_catalog
+from src.models.problem import SUPPORTED_PROBLEM_TYPES
+from src.utils.picker_session import PickerSession
+from src.utils.problem_picker import build_problem_mask, list_companies
+
+PROFILES_DIR = os.path.join("data", "profiles")
+# A pick takes well under a millisecond, so smaller batches are answered
+# in-process: a pool only pays off once it outweighs every worker's start-up
+POOL_THRESHOLD = 2000
+# Spec fields that must be lists of strings; a bare string would be read
+# one character at a time
+LIST_FIELDS = ["list", "topics", "exclude_topics", "difficulty"]
+
+
+class BatchPicker:
+    """
+    Answers pick specs against one shared catalog. Each profile's history is
+    loaded once, the first time a spec for that profile is seen.
+    """
+
+    def __init__(self, catalog=None):
+        self.catalog = catalog or load_catalog()
+        self.sessions = {}
+
+    def session_for(self, profile):
+        if profile not in self.sessions:
+            if profile:
+                user_dir = os.path.join(PROFILES_DIR, profile)
+                if not os.path.isdir(user_dir):
+                    raise ValueError(f"Unknown profile: {profile}")
+                catalog = self.catalog.for_user(user_dir)
+            else:
+                catalog = self.catalog
+            self.sessions[profile] = PickerSession(catalog)
+        return self.sessions[profile]
+
+    def pick(self, spec):
+        """Returns the result record for one pick spec"""
+        result = {"id": spec.get("id")}
+        try:
+            for field in LIST_FIELDS:
+                value = spec.get(field)
+                if value is not None and not (
+                    isinstance(value, list)
+                    and all(isinstance(item, str) for item in value)
+                ):
+                    raise ValueError(f"{field} must be a list of strings")
+            k = spec.get("k", 5)
+            if not isinstance(k, int) or isinstance(k, bool) or k < 0:
+                raise ValueError("k must be a non-negative integer")
+            session = self.session_for(spec.get("profile"))
+            catalog = session.catalog
+            list_names = spec.get("list", ["blind75"])
+            problem_type = spec.get("problem_type", "Random")
+            if problem_type not in SUPPORTED_PROBLEM_TYPES:
+                raise ValueError(f"Unknown problem_type: {problem_type}")
+            if "seed" in spec:
+                random.seed(spec["seed"])
+            result["problems"] = session.pick(
+                problems=build_problem_mask(catalog, list_names),
+                topic_list=spec.get("topics") or list(catalog.topics),
+                exclude_topics=spec.get("exclude_topics"),
+                difficulty_list=spec.get("difficulty"),
+                k=k,
+                problem_type=problem_type,
+                companies=list_companies(catalog, list_names),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            result["error"] = str(e)
+        return result
+
+
+_worker = None
+
+
+def _init_worker():
+    global _worker
+    _worker = BatchPicker()
+
+
+def _pick_in_worker(spec):
+    return _worker.pick(spec)
+
+
+def read_specs(lines):
+    """Parses JSONL pick specs, numbering those without an id by line"""
+    specs = []
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            spec = json.loads(line)
+        except json.JSONDecodeError as e:
+            spec = {"error": f"Invalid JSON: {e}"}
+        if not isinstance(spec, dict):
+            spec = {"error": "A pick spec must be a JSON object"}
+        spec.setdefault("id", line_number)
+        specs.append(spec)
+    return specs
+
+
+def run_batch(specs, workers=None):
+    """Yields one result per spec, in order"""
+    workers = workers or os.cpu_count() or 1
+    valid = [spec for spec in specs if "error" not in spec]
+
+    if workers > 1 and len(valid) >= POOL_THRESHOLD:
+        # Every worker loads the catalog once, then answers a chunk of specs
+        with Pool(workers, initializer=_init_worker) as pool:
+            chunksize = max(1, len(valid) // (workers * 4))
+            results = iter(pool.imap(_pick_in_worker, valid, chunksize))
+            for spec in specs:
+                if "error" in spec:
+                    yield {"id": spec["id"], "error": spec["error"]}
+                else:
+                    yield next(results)
+        return
+
+    picker = BatchPicker()
+    for spec in specs:
+        if "error" in spec:
+            yield {"id": spec["id"], "error": spec["error"]}
+        else:
+            yield picker.pick(spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Answer many pick requests from a JSONL file in one process"
+    )
+    parser.add_argument(
+        "specs",
+        nargs="?",
+        default="-",
+        help="JSONL file of pick specs (default: stdin)",
+    )
+    parser.add_argument("--output", "-o", help="Where to write JSONL results")
+    parser.add_argument(
+        "--workers", "-w", type=int, help="Worker processes for large batches"
+    )
+    args = parser.parse_args()
+
+    if args.specs == "-":
+        specs = read_specs(sys.stdin)
+    else:
+        with open(args.specs) as f:
+            specs = read_specs(f)
+
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        for result in run_batch(specs, args.workers):
+            output.write(json.dumps(result) + "\n")
+    finally:
+        if args.output:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import json
+import os
+import socket
+import sys
+
+from src.utils.profiling import profile_destination
+
+# Relative to the repository root, like every other data path
+SOCKET_PATH = os.path.join("data", ".cache", "lcpp.sock")
+CONNECT_TIMEOUT = 0.5
+# Generous, since the first request after a data change rebuilds the catalog
+RESPONSE_TIMEOUT = 60
+
+
+def request(message, socket_path=SOCKET_PATH):
+    """
+    Sends one request to the picker daemon and returns its response, or None
+    when no daemon is listening on socket_path.
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(CONNECT_TIMEOUT)
+            client.connect(socket_path)
+            client.settimeout(RESPONSE_TIMEOUT)
+            client.sendall(json.dumps(message).encode() + b"\n")
+            with client.makefile("rb") as response:
+                line = response.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
+def run_cli(argv, socket_path=SOCKET_PATH):
+    """
+    Runs a main.py command line on the daemon and prints its output. Returns
+    False when the command has to run in-process instead: no daemon is
+    running, the command is interactive, or profiling is on.
+    """
+    if profile_destination():
+        return False
+    response = request({"cmd": "cli", "argv": list(argv)}, socket_path)
+    if response is None or response.get("fallback"):
+        return False
+    if "error" in response:
+        print(response["error"], file=sys.stderr)
+        sys.exit(1)
+    sys.stdout.write(response["output"])
+    return True
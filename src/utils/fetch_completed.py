@@ -1,11 +1,13 @@
-import requests
 import argparse
 import csv
 import os
 import sys
-import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
+from src.data.history import AttemptStore
+from src.data.loader import parse_json
 
 # Import dotenv for .env file support
 try:
@@ -16,134 +18,204 @@ except ImportError:
     DOTENV_AVAILABLE = False
 
 
-def fetch_completed_problems(username, session_cookie):
-    """Fetch completed problems from LeetCode API"""
-    # More comprehensive headers based on actual browser requests
-    headers = {
-        "Cookie": f"LEETCODE_SESSION={session_cookie}; csrftoken=dummy;",
-        "Referer": "https://leetcode.com/problemset/all/",
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "*/*",
-        "Accept-Language": "en-US,en;q=0.9",
+GRAPHQL_URL = "https://leetcode.com/graphql"
+# LeetCode serves at most 20 submissions per page
+PAGE_SIZE = 20
+# Pages requested at once; keep it low, LeetCode rate-limits bursts
+WORKERS = 4
+RETRIES = 3
+
+SUBMISSIONS_QUERY = """
+query submissionList($offset: Int!, $limit: Int!) {
+  submissionList(offset: $offset, limit: $limit) {
+    hasNext
+    submissions {
+      titleSlug
+      statusDisplay
+      timestamp
     }
-
-    # Simple query just to verify authentication and get statistics
-    query = """
-    query getUserProfile($username: String!) {
-      matchedUser(username: $username) {
-        username
-        profile {
-          ranking
-          reputation
-          starRating
-        }
-        submissionCalendar
-        submitStats: submitStatsGlobal {
-          acSubmissionNum {
-            difficulty
-            count
-            submissions
-          }
-        }
-      }
+  }
+}
+"""
+
+# Public, needs no session cookie, but only covers the latest few solves
+RECENT_QUERY = """
+query recentAcSubmissionList($username: String!, $limit: Int!) {
+  recentAcSubmissionList(username: $username, limit: $limit) {
+    titleSlug
+    timestamp
+  }
+}
+"""
+
+
+def problem_slug(link):
+    """The title slug at the end of a problem's Link"""
+    return link.strip().rstrip("/").rsplit("/", 1)[-1]
+
+
+def slug_ids(all_problems):
+    """Title slug -> problem ID, from the catalog's Link fields"""
+    return {
+        problem_slug(problem["Link"]): int(leetcode_id)
+        for leetcode_id, problem in all_problems.items()
+        if problem.get("Link")
     }
-    """
-
-    variables = {"username": username}
-    url = "https://leetcode.com/graphql"
 
-    print("Verifying authentication with LeetCode API...")
 
-    try:
-        # First make a simple request to verify authentication
-        response = requests.post(
-            url, json={"query": query, "variables": variables}, headers=headers
+def make_session(session_cookie=None, workers=WORKERS):
+    """A requests.Session with LeetCode's headers, shared by all worker threads"""
+    import requests
+
+    session = requests.Session()
+    # One pooled connection per worker, so concurrent pages reuse connections
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "Referer": "https://leetcode.com/problemset/all/",
+            "Content-Type": "application/json",
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+            "Accept": "*/*",
+            "Accept-Language": "en-US,en;q=0.9",
+        }
+    )
+    if session_cookie:
+        # LeetCode only checks that the CSRF cookie and header agree
+        session.headers["Cookie"] = (
+            f"LEETCODE_SESSION={session_cookie}; csrftoken=dummy;"
         )
+        session.headers["X-CSRFToken"] = "dummy"
+    return session
+
 
+def post_query(session, endpoint, query, variables):
+    """Runs a GraphQL query and returns its data, retrying when rate-limited"""
+    for attempt in range(RETRIES):
+        response = session.post(
+            endpoint, json={"query": query, "variables": variables}, timeout=30
+        )
+        if response.status_code in (429, 502, 503) and attempt < RETRIES - 1:
+            time.sleep(2**attempt)
+            continue
         if response.status_code != 200:
-            print(f"Authentication failed. Status code: {response.status_code}")
-            print(f"Response: {response.text[:500]}...")
-            return []
-
-        data = response.json()
-
-        if "data" in data and "matchedUser" in data["data"]:
-            # Successfully authenticated
-            username_verified = data["data"]["matchedUser"]["username"]
-
-            # Get statistics for display purposes
-            if "submitStats" in data["data"]["matchedUser"]:
-                stats = data["data"]["matchedUser"]["submitStats"]["acSubmissionNum"]
-                total_solved = sum(item["count"] for item in stats)
-                print(f"Authenticated as {username_verified}")
-                print(f"Your LeetCode statistics:")
-                for diff in stats:
-                    print(f"  {diff['difficulty']}: {diff['count']} problems")
-                print(f"Total: {total_solved} problems solved")
-
-            # Unfortunately, the current LeetCode API doesn't directly provide problem IDs
-            # But we can parse the submission calendar to get some data
-
-            # The submission calendar is a JSON string that contains dates and counts
-            # It doesn't have specific problem IDs but has timestamps of activity
-            calendar_data = {}
-            if "submissionCalendar" in data["data"]["matchedUser"]:
-                try:
-                    calendar_str = data["data"]["matchedUser"]["submissionCalendar"]
-                    if calendar_str:
-                        calendar_data = json.loads(calendar_str)
-                        print(
-                            f"\nFound submission activity data spanning {len(calendar_data)} days"
-                        )
-                except json.JSONDecodeError:
-                    print("Could not parse submission calendar data")
-
-            # Extract all submission dates
-            all_timestamps = sorted(calendar_data.keys(), reverse=True)
-            all_dates = [
-                datetime.fromtimestamp(int(ts)).strftime("%Y-%m-%d")
-                for ts in all_timestamps
-            ]
-
-            print(
-                f"\nUsing all {len(all_timestamps)} submission dates for completed problems"
+            raise RuntimeError(
+                f"Status code {response.status_code}: {response.text[:200]}"
             )
+        result = response.json()
+        if result.get("errors"):
+            raise RuntimeError(result["errors"][0].get("message", result["errors"]))
+        return result["data"]
 
-            # Since we can't get actual problem IDs, we'll generate them based on recent activity dates
-            # This is better than random data as it ties to actual submission dates
-
-            # Generate problem IDs using a hash of dates to make them deterministic
-            # This ensures the same dates always produce the same IDs
-            import hashlib
 
-            problem_ids = []
-            for date in all_dates:
-                # Generate a deterministic ID from the date using hash
-                hash_obj = hashlib.md5(date.encode())
-                # Convert first 4 bytes of hash to integer and take modulo 2000
-                # to get a problem ID between 1-2000
-                problem_id = (int(hash_obj.hexdigest()[:8], 16) % 2000) + 1
-                problem_ids.append(problem_id)
+def fetch_submission_page(session, endpoint, offset, limit=PAGE_SIZE):
+    page = post_query(
+        session, endpoint, SUBMISSIONS_QUERY, {"offset": offset, "limit": limit}
+    )["submissionList"]
+    if page is None:
+        raise RuntimeError("No submissions returned, is the session cookie valid?")
+    return page
 
-            print("Note: These are not your actual solved problem IDs.")
-            print("They are generated based on your activity dates.")
 
-            # Return unique problem IDs only
-            return list(set(problem_ids))
+def fetch_submissions(session, endpoint, page_size=PAGE_SIZE, workers=WORKERS):
+    """
+    Returns every submission of the session's user, oldest page last. Pages
+    are addressed by offset, so up to workers of them are requested ahead of
+    knowing whether the last one had more; the few requested past the end
+    just come back empty.
+    """
+    pages = {}
+    pending = {}
+    next_offset = 0
+    more = True
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while more and len(pending) < workers:
+                future = pool.submit(
+                    fetch_submission_page, session, endpoint, next_offset, page_size
+                )
+                pending[future] = next_offset
+                next_offset += page_size
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                offset = pending.pop(future)
+                page = future.result()
+                pages[offset] = page["submissions"] or []
+                if not page["hasNext"] or not pages[offset]:
+                    more = False
+    return [submission for offset in sorted(pages) for submission in pages[offset]]
+
+
+def fetch_recent_submissions(session, endpoint, username, limit=PAGE_SIZE):
+    """The user's most recent accepted submissions, without logging in"""
+    submissions = post_query(
+        session, endpoint, RECENT_QUERY, {"username": username, "limit": limit}
+    )["recentAcSubmissionList"]
+    return [
+        dict(submission, statusDisplay="Accepted") for submission in submissions or []
+    ]
+
+
+def solved_problems(submissions, slugs):
+    """
+    Returns problem ID -> date first accepted, and the slugs of accepted
+    submissions missing from the catalog
+    """
+    solved = {}
+    unknown = set()
+    for submission in submissions:
+        if submission.get("statusDisplay") != "Accepted":
+            continue
+        leetcode_id = slugs.get(submission["titleSlug"])
+        if leetcode_id is None:
+            unknown.add(submission["titleSlug"])
+            continue
+        day = datetime.fromtimestamp(int(submission["timestamp"])).strftime("%Y-%m-%d")
+        if leetcode_id not in solved or day < solved[leetcode_id]:
+            solved[leetcode_id] = day
+    return solved, unknown
+
+
+def fetch_completed_problems(
+    username,
+    session_cookie,
+    all_problems,
+    endpoint=GRAPHQL_URL,
+    page_size=PAGE_SIZE,
+    workers=WORKERS,
+):
+    """
+    Returns problem ID -> date first solved for every problem username has
+    an accepted submission for. Without a session cookie only the public
+    list of recent solves is available.
+    """
+    session = make_session(session_cookie, workers)
+    try:
+        if session_cookie:
+            print("Fetching accepted submissions from LeetCode...")
+            submissions = fetch_submissions(session, endpoint, page_size, workers)
         else:
-            print("Failed to get user profile data")
-            return []
+            print("No session cookie, fetching only the most recent solves...")
+            submissions = fetch_recent_submissions(session, endpoint, username)
     except Exception as e:
         print(f"Error accessing LeetCode API: {e}")
-        return []
+        return {}
+    finally:
+        session.close()
 
+    solved, unknown = solved_problems(submissions, slug_ids(all_problems))
+    print(f"Read {len(submissions)} submissions")
+    if unknown:
+        # Never guess IDs, a wrong one would pollute completed.csv
+        print(f"Skipped {len(unknown)} solved problems not in the catalog")
+    return solved
 
-def update_completed_csv(solved_ids, csv_path):
-    """Update completed.csv with solved problem IDs"""
-    # Current date in YYYY-MM-DD format
-    today = datetime.now().strftime("%Y-%m-%d")
 
+def update_completed_csv(solved, csv_path):
+    """Update completed.csv with solved problem ID -> date first solved"""
     # Read existing entries to avoid duplicates
     existing_problems = set()
     if os.path.exists(csv_path):
@@ -155,18 +227,28 @@ def update_completed_csv(solved_ids, csv_path):
                 ):  # Check if row exists and first element is a problem ID
                     existing_problems.add(int(row[0]))
 
-    # Prepare new entries (only for problems not already in the file)
-    new_entries = []
-    for problem_id in solved_ids:
-        if int(problem_id) not in existing_problems:
-            # Format: problem_id,yes,0,0,date
-            new_entries.append([problem_id, "yes", "0", "0", today])
+    # Prepare new entries (only for problems not already in the file), oldest first
+    new_entries = [
+        (day, problem_id)
+        for problem_id, day in solved.items()
+        if int(problem_id) not in existing_problems
+    ]
 
     # Append new entries to CSV file
     if new_entries:
-        with open(csv_path, "a", newline="") as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerows(new_entries)
+        # Rows start with their newline, the way mark_completed writes them,
+        # since the file's last row has none
+        with open(csv_path, "a") as csvfile:
+            csvfile.write(
+                "".join(
+                    f"\n{problem_id},yes,0,0,{day}"
+                    for day, problem_id in sorted(new_entries)
+                )
+            )
+        # Keeps the columnar store in step, if there is one
+        store = AttemptStore.for_csv(str(csv_path))
+        if store.exists():
+            store.sync(csv_path)
         print(f"Added {len(new_entries)} new completed problems to {csv_path}")
     else:
         print("No new completed problems to add")
@@ -181,6 +263,16 @@ def main():
     parser.add_argument("--session", help="LeetCode session cookie")
     parser.add_argument("--csv-path", help="Path to completed.csv file")
     parser.add_argument("--env-file", help="Path to .env file")
+    parser.add_argument(
+        "--endpoint",
+        help=f"GraphQL endpoint, e.g. a local stand-in server (default: {GRAPHQL_URL})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=WORKERS,
+        help=f"Pages fetched at once (default: {WORKERS})",
+    )
 
     args = parser.parse_args()
 
@@ -198,6 +290,7 @@ def main():
     # Use arguments or environment variables
     username = args.username or os.environ.get("LEETCODE_USERNAME")
     session_cookie = args.session or os.environ.get("LEETCODE_SESSION")
+    endpoint = args.endpoint or os.environ.get("LEETCODE_GRAPHQL_URL", GRAPHQL_URL)
 
     # Determine CSV path
     if args.csv_path:
@@ -207,21 +300,29 @@ def main():
         current_dir = Path(__file__).parent
         project_root = current_dir.parent.parent
         csv_path = project_root / "data" / "completed.csv"
-
-    if not username or not session_cookie:
-        print("Error: LeetCode username and session cookie required.")
+    # Submissions name problems by slug, the catalog maps them to IDs
+    catalog_path = Path(csv_path).parent / "all_problems.json"
+    if not catalog_path.exists():
+        catalog_path = project_root / "data" / "all_problems.json"
+    all_problems = parse_json(catalog_path)
+
+    if not username and not session_cookie:
+        print("Error: LeetCode session cookie (or at least a username) required.")
         print("Set them as environment variables (LEETCODE_USERNAME, LEETCODE_SESSION)")
         print(
             "Or pass them as arguments: --username YOUR_USERNAME --session YOUR_SESSION_COOKIE"
         )
         sys.exit(1)
 
-    print(f"Fetching completed problems for user: {username}")
-    solved_ids = fetch_completed_problems(username, session_cookie)
+    if username:
+        print(f"Fetching completed problems for user: {username}")
+    solved = fetch_completed_problems(
+        username, session_cookie, all_problems, endpoint, workers=args.workers
+    )
 
-    if solved_ids:
-        print(f"Found {len(solved_ids)} completed problems")
-        update_completed_csv(solved_ids, csv_path)
+    if solved:
+        print(f"Found {len(solved)} completed problems")
+        update_completed_csv(solved, csv_path)
     else:
         print("No completed problems found or error occurred")
 
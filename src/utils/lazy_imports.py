@@ -0,0 +1,11 @@
+def load_numpy():
+    """
+    Returns numpy, or None when it is not installed. Modules that can use it
+    call this when they need it instead of importing it at the top: importing
+    NumPy takes longer than most commands take to run.
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
@@ -0,0 +1,180 @@
+import heapq
+import re
+from array import array
+from src.utils.lazy_imports import load_numpy
+
+_WORD = re.compile(r"[a-z0-9]+")
+# Dice similarity a name word needs to stand in for a query word, and share
+# of the query's words a name has to match overall
+MIN_SIMILARITY = 0.5
+# Below this many names the plain Python scoring is as fast, without
+# paying for importing NumPy
+NUMPY_MIN_NAMES = 20000
+
+
+def normalize(name):
+    """Lowercases name and keeps only its words"""
+    return " ".join(_WORD.findall(name.lower()))
+
+
+def trigrams(word):
+    """
+    The trigrams of word padded with two spaces in front and one behind, so
+    short words and word starts count too
+    """
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Two-level index over problem names. Names share a small vocabulary, so a
+    query's words are matched fuzzily against the vocabulary through a
+    trigram index, and the postings of the words matched give the names to
+    score. The vocabulary's own near neighbours are worked out up front, so a
+    query made of known words never touches the trigram index at all.
+    """
+
+    def __init__(self, all_problems):
+        self.ids = array("I", sorted(int(key) for key in all_problems))
+        self.names = [
+            normalize(all_problems[str(leetcode_id)].get("Name", ""))
+            for leetcode_id in self.ids
+        ]
+        self.lengths = array("I", (len(name) for name in self.names))
+
+        # word -> positions of the names using it
+        word_names = {}
+        for position, name in enumerate(self.names):
+            for word in set(name.split()):
+                word_names.setdefault(word, []).append(position)
+        self.words = sorted(word_names)
+        self.word_index = {word: i for i, word in enumerate(self.words)}
+        self.word_names = [array("I", word_names[word]) for word in self.words]
+
+        # trigram -> indices of the words containing it
+        self.word_grams = array("I")
+        gram_words = {}
+        for word_index, word in enumerate(self.words):
+            grams = trigrams(word)
+            self.word_grams.append(len(grams))
+            for gram in grams:
+                gram_words.setdefault(gram, []).append(word_index)
+        self.gram_words = {
+            gram: array("I", word_indices) for gram, word_indices in gram_words.items()
+        }
+        self.neighbours = [self._similar_words(word) for word in self.words]
+
+    def _similar_words(self, word):
+        grams = trigrams(word)
+        shared = {}
+        for gram in grams:
+            for word_index in self.gram_words.get(gram, ()):
+                shared[word_index] = shared.get(word_index, 0) + 1
+        similar = {}
+        for word_index, count in shared.items():
+            similarity = 2 * count / (len(grams) + self.word_grams[word_index])
+            if similarity >= MIN_SIMILARITY:
+                similar[word_index] = similarity
+        return similar
+
+    def similar_words(self, word):
+        """Returns word index -> Dice similarity for the words resembling word"""
+        if word in self.word_index:
+            return self.neighbours[self.word_index[word]]
+        return self._similar_words(word)
+
+    def search(self, query, k=5):
+        """Returns up to k (problem ID, similarity) pairs, best match first"""
+        query = normalize(query)
+        query_words = list(dict.fromkeys(query.split()))
+        if not query_words:
+            return []
+
+        similar = [self.similar_words(word) for word in query_words]
+        needed = MIN_SIMILARITY * len(query_words)
+        if len(self.names) >= NUMPY_MIN_NAMES and load_numpy() is not None:
+            scores = self._numpy_scores(similar, needed, query, k)
+        else:
+            scores = self._scores(similar, needed)
+        best = heapq.nlargest(
+            k,
+            (
+                (
+                    score,
+                    f" {query} " in f" {self.names[position]} ",
+                    -abs(self.lengths[position] - len(query)),
+                    -self.ids[position],
+                )
+                for position, score in scores
+            ),
+        )
+        return [
+            (-negated_id, score / len(query_words)) for score, _, _, negated_id in best
+        ]
+
+    def _scores(self, similar, needed):
+        """(position, score) of the names scoring needed or more"""
+        # Each query word adds the similarity of its best match in a name
+        scores = {}
+        for word_similarity in similar:
+            best = {}
+            for word_index, similarity in word_similarity.items():
+                for position in self.word_names[word_index]:
+                    if best.get(position, 0) < similarity:
+                        best[position] = similarity
+            for position, similarity in best.items():
+                scores[position] = scores.get(position, 0) + similarity
+        return [
+            (position, score) for position, score in scores.items() if score >= needed
+        ]
+
+    def _numpy_scores(self, similar, needed, query, k):
+        """The same scores with array operations, cut down to the best k"""
+        numpy = load_numpy()
+        scores = numpy.zeros(len(self.names))
+        best = numpy.zeros(len(self.names))
+        for word_similarity in similar:
+            if not word_similarity:
+                continue
+            positions = numpy.concatenate(
+                [
+                    numpy.frombuffer(self.word_names[word_index], dtype=numpy.uint32)
+                    for word_index in word_similarity
+                ]
+            )
+            similarities = numpy.repeat(
+                list(word_similarity.values()),
+                [len(self.word_names[word_index]) for word_index in word_similarity],
+            )
+            numpy.maximum.at(best, positions, similarities)
+            scores[positions] += best[positions]
+            best[positions] = 0
+
+        matches = numpy.flatnonzero(scores >= needed)
+        if len(matches) > k:
+            kth = numpy.partition(scores[matches], -k)[-k]
+            matches = matches[scores[matches] >= kth]
+        if len(matches) > k:
+            # Break the ties at the k-th score the way search ranks them
+            lengths = numpy.frombuffer(self.lengths, dtype=numpy.uint32)[matches]
+            ids = numpy.frombuffer(self.ids, dtype=numpy.uint32)[matches]
+            # Only a name matching every query word exactly can contain the query
+            contains = numpy.zeros(len(matches), dtype=bool)
+            for i in numpy.flatnonzero(scores[matches] == len(similar)).tolist():
+                contains[i] = f" {query} " in f" {self.names[matches[i]]} "
+            order = numpy.lexsort(
+                (
+                    -ids.astype(numpy.int64),
+                    -numpy.abs(lengths.astype(numpy.int64) - len(query)),
+                    contains,
+                    scores[matches],
+                )
+            )
+            matches = matches[order[-k:]]
+        return zip(matches.tolist(), scores[matches].tolist())
+
+    def find(self, query):
+        """Returns the ID of the problem best matching query, or None"""
+        matches = self.search(query, 1)
+        return matches[0][0] if matches else None
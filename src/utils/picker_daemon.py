@@ -0,0 +1,252 @@
+"""
+Keeps the catalog, topics and user history loaded in a long-running process
+and answers requests over a Unix domain socket, one JSON object per line:
+
+    {"cmd": "pick", "list": ["google"], "topics": ["graph"], "k": 3}
+    {"cmd": "info", "id": 1}
+    {"cmd": "mark", "id": 1, "was_solved": "yes", "num_errs": "0", "time": "15"}
+    {"cmd": "mark", "id": 1, "type": "revisit"}
+    {"cmd": "cli", "argv": ["-t", "dp", "-k", "3"]}
+    {"cmd": "ping"} / {"cmd": "stop"}
+
+pick takes the same fields as a batch pick spec. Every response is one JSON
+object, with an "error" key when the request failed.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+
+from main import build_parser, run_command
+from src.data.loader import DATABASE, Catalog, get_data_path
+from src.ui.display import print_info
+from src.utils.batch_picker import BatchPicker
+from src.utils.daemon_client import SOCKET_PATH, request
+from src.utils.problem_tracker import MARK_TYPES, MARKS_JOURNAL
+
+CATALOG_FILES = [
+    "all_problems.json",
+    "company_to_problems.json",
+    "problem_to_companies.json",
+    "topics.json",
+]
+# A SQLite database commits to its write-ahead log first
+USER_FILES = ["user.json", "completed.csv", MARKS_JOURNAL, DATABASE, f"{DATABASE}-wal"]
+
+
+def _stamp(paths):
+    stamp = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+
+class PickerDaemon:
+    """
+    Answers requests from memory. Before each request the data files are
+    stat'ed, so edits made by other processes (an in-process lcpp run,
+    fetch_completed, a text editor) are picked up on the next request.
+    """
+
+    def __init__(self):
+        self.picker = BatchPicker()
+        self.catalog_stamp = _stamp(self.catalog_paths())
+        self.user_stamps = self.stamp_users()
+        self.stopped = None
+
+    def catalog_paths(self):
+        return [get_data_path(filename) for filename in CATALOG_FILES]
+
+    def stamp_users(self):
+        """Returns user_dir -> stamp of its files, for every loaded profile"""
+        user_dirs = {
+            session.catalog.user_dir for session in self.picker.sessions.values()
+        }
+        user_dirs.add(self.picker.catalog.user_dir)
+        return {
+            user_dir: _stamp(
+                [get_data_path(filename, user_dir) for filename in USER_FILES]
+            )
+            for user_dir in user_dirs
+        }
+
+    def refresh(self):
+        """Drops whatever was loaded from files that changed since last time"""
+        catalog_stamp = _stamp(self.catalog_paths())
+        if catalog_stamp != self.catalog_stamp:
+            self.picker = BatchPicker()
+            self.catalog_stamp = catalog_stamp
+            self.user_stamps = self.stamp_users()
+            return
+
+        user_stamps = self.stamp_users()
+        # A profile loaded since the last check was read after its last change
+        changed = any(
+            self.user_stamps.get(user_dir, stamp) != stamp
+            for user_dir, stamp in user_stamps.items()
+        )
+        self.user_stamps = user_stamps
+        if changed:
+            # Keep the shared catalog, reload only the users' files
+            catalog = self.picker.catalog
+            self.picker = BatchPicker(catalog.for_user(catalog.user_dir))
+
+    def handle(self, message):
+        """Returns the response to one decoded request"""
+        if not isinstance(message, dict):
+            return {"error": "A request must be a JSON object"}
+        command = message.get("cmd")
+        if command == "ping":
+            return {"pid": os.getpid()}
+        if command == "stop":
+            self.stopped.set()
+            return {"stopped": True}
+
+        self.refresh()
+        try:
+            if command == "pick":
+                return self.picker.pick(message)
+            if command == "info":
+                return {"output": self.info(int(message["id"]))}
+            if command == "mark":
+                self.mark(message)
+                return {"marked": message["id"]}
+            if command == "cli":
+                return self.cli(message["argv"])
+        except (ValueError, KeyError, TypeError) as e:
+            return {"error": str(e)}
+        return {"error": f"Unknown command: {command}"}
+
+    def info(self, leetcode_id):
+        catalog = self.picker.catalog
+        if str(leetcode_id) not in catalog.all_problems:
+            raise ValueError(f"Unknown problem ID: {leetcode_id}")
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            print_info(
+                catalog.all_problems,
+                catalog.problem_to_companies,
+                catalog.my_companies,
+                leetcode_id,
+            )
+        return output.getvalue()
+
+    def mark(self, message):
+        session = self.picker.session_for(message.get("profile"))
+        leetcode_id = int(message["id"])
+        # Checked before writing anything: an unknown ID would end up in the
+        # history or the review schedule and break later picks
+        if str(leetcode_id) not in session.catalog.all_problems:
+            raise ValueError(f"Unknown problem ID: {leetcode_id}")
+        if "type" in message:
+            if message["type"] not in MARK_TYPES:
+                raise ValueError(f"Unknown mark type: {message['type']}")
+            session.mark_problem(message["type"], leetcode_id)
+        else:
+            session.mark_completed(
+                leetcode_id,
+                message["was_solved"],
+                str(message.get("num_errs", 0)),
+                str(message.get("time", 0)),
+            )
+        # The session already holds the mark, so this write needs no reload
+        self.user_stamps = self.stamp_users()
+
+    def cli(self, argv):
+        """Runs a main.py command line, or asks the client to run it itself"""
+        try:
+            with contextlib.redirect_stderr(io.StringIO()):
+                args = build_parser().parse_args(argv)
+        except SystemExit:
+            # --help and usage errors are printed by the client's own parser
+            return {"fallback": True}
+        if args.interactive or args.help_menu or args.compact_marks:
+            return {"fallback": True}
+        if args.profile or args.profile_dump or args.trace_malloc:
+            # Profiling measures the process it runs in
+            return {"fallback": True}
+
+        session = self.picker.session_for(None)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            run_command(args, session.catalog, session)
+        return {"output": output.getvalue()}
+
+    async def serve_client(self, reader, writer):
+        try:
+            while not self.stopped.is_set():
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = self.handle(json.loads(line))
+                except json.JSONDecodeError as e:
+                    response = {"error": f"Invalid JSON: {e}"}
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, socket_path):
+        self.stopped = asyncio.Event()
+        server = await asyncio.start_unix_server(self.serve_client, socket_path)
+        try:
+            async with server:
+                await self.stopped.wait()
+        finally:
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+
+def start(socket_path=SOCKET_PATH):
+    if request({"cmd": "ping"}, socket_path):
+        print(f"A daemon is already listening on {socket_path}")
+        sys.exit(1)
+    if os.path.exists(socket_path):
+        # Left behind by a daemon that did not shut down cleanly
+        os.remove(socket_path)
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+
+    daemon = PickerDaemon()
+    # Load everything up front, so the first request is as fast as the rest
+    catalog = daemon.picker.session_for(None).catalog
+    for name in Catalog.SHARED:
+        getattr(catalog, name)
+    print(f"Listening on {socket_path} (pid {os.getpid()})")
+    try:
+        asyncio.run(daemon.serve(socket_path))
+    except KeyboardInterrupt:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve picks from a warm process over a Unix socket"
+    )
+    parser.add_argument(
+        "action",
+        nargs="?",
+        choices=["start", "stop", "status"],
+        default="start",
+        help="Run the daemon in the foreground, stop it, or check on it",
+    )
+    parser.add_argument("--socket", default=SOCKET_PATH, help="Socket path")
+    args = parser.parse_args()
+
+    if args.action == "start":
+        start(args.socket)
+    elif args.action == "stop":
+        print("Stopped" if request({"cmd": "stop"}, args.socket) else "Not running")
+    else:
+        response = request({"cmd": "ping"}, args.socket)
+        print(f"Running (pid {response['pid']})" if response else "Not running")
+
+
+if __name__ == "__main__":
+    main()
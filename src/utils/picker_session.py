@@ -0,0 +1,93 @@
+from src.utils import review_scheduler, skill_ratings
+from src.utils.problem_picker import build_skip_mask, pick_problems
+from src.utils.profiling import stage
+
+
+class PickerSession:
+    """
+    Loads the user's history once and keeps it in memory for a whole session.
+    Marks are written through to disk and applied to the in-memory skip mask,
+    so replacement picks never re-read completed.csv.
+    """
+
+    def __init__(self, catalog, problem_type="Random", companies=None):
+        self.catalog = catalog
+        self.problem_type = problem_type
+        self.companies = companies
+        self.user_data = catalog.user_data
+        self.index = catalog.index
+        self.completed = set(catalog.completed)
+        self.skip_mask = build_skip_mask(self.user_data, self.completed)
+        self._reviews = None
+        self._ratings = None
+
+    @property
+    def reviews(self):
+        """The spaced-repetition schedule, loaded on first use"""
+        if self._reviews is None:
+            self._reviews = review_scheduler.load_reviews(self.catalog)
+        return self._reviews
+
+    @property
+    def ratings(self):
+        """The per-topic skill ratings, loaded on first use"""
+        if self._ratings is None:
+            self._ratings = skill_ratings.load_ratings(self.catalog)
+        return self._ratings
+
+    def _save_reviews(self):
+        review_scheduler.save_schedule(
+            self._reviews, review_scheduler.get_schedule_path(self.catalog.user_dir)
+        )
+
+    def pick(
+        self,
+        problems,
+        topic_list,
+        exclude_topics=None,
+        difficulty_list=None,
+        k=5,
+        problem_type=None,
+        companies=None,
+    ):
+        problem_type = problem_type or self.problem_type
+        return pick_problems(
+            user_data=self.user_data,
+            all_problems=None,
+            problems=problems,
+            topics=self.catalog.topics,
+            topic_list=topic_list,
+            exclude_topics=exclude_topics,
+            difficulty_list=difficulty_list,
+            k=k,
+            problem_type=problem_type,
+            index=self.index,
+            skip_mask=self.skip_mask,
+            companies=companies or self.companies,
+            ratings=self.ratings if problem_type == "LevelUp" else None,
+        )
+
+    def mark_completed(self, leetcode_id, was_solved, num_errs, time):
+        with stage("mark"):
+            self._mark_completed(leetcode_id, was_solved, num_errs, time)
+
+    def _mark_completed(self, leetcode_id, was_solved, num_errs, time):
+        self.catalog.storage.mark_completed(leetcode_id, was_solved, num_errs, time)
+        self.completed.add(leetcode_id)
+        self.skip_mask |= 1 << leetcode_id
+        if self._reviews is not None:
+            # Reads back just the row written above
+            review_scheduler.update_schedule(self._reviews, self.catalog)
+            self._save_reviews()
+        if self._ratings is not None:
+            skill_ratings.update_ratings(self._ratings, self.catalog)
+            skill_ratings.save_ratings(
+                self._ratings, skill_ratings.get_ratings_path(self.catalog.user_dir)
+            )
+
+    def mark_problem(self, mark_type, leetcode_id):
+        self.catalog.storage.mark_problem(self.user_data, mark_type, leetcode_id)
+        self.skip_mask |= 1 << leetcode_id
+        if self._reviews is not None and mark_type in review_scheduler.REVIEW_LISTS:
+            self._reviews.add(leetcode_id, review_scheduler.today())
+            self._save_reviews()
@@ -0,0 +1,208 @@
+import random
+from array import array
+from src.utils.skill_ratings import problem_rating, problem_topics, topic_names
+from src.utils.weighted_sampler import AliasTable, problem_weight
+
+
+# Frequencies in recent windows count for more in the Common ranking
+DURATION_WEIGHTS = {"6months": 4, "1year": 3, "2year": 2, "alltime": 1}
+
+
+def _score(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Bit positions set in each possible byte value, used to decode masks quickly
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def mask_of(problem_ids):
+    """Returns a bitmask with bit i set for every problem ID i >= 0"""
+    problem_ids = [
+        problem_id
+        for problem_id in problem_ids
+        if isinstance(problem_id, int) and problem_id >= 0
+    ]
+    if not problem_ids:
+        return 0
+    buffer = bytearray((max(problem_ids) >> 3) + 1)
+    for problem_id in problem_ids:
+        buffer[problem_id >> 3] |= 1 << (problem_id & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def ids_of(mask):
+    """Returns the problem IDs set in mask, in ascending order"""
+    problem_ids = []
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    for offset, byte in enumerate(data):
+        if byte:
+            base = offset << 3
+            problem_ids.extend(base + bit for bit in _BYTE_BITS[byte])
+    return problem_ids
+
+
+if hasattr(int, "bit_count"):
+    popcount = int.bit_count
+else:  # Python < 3.10
+
+    def popcount(mask):
+        return bin(mask).count("1")
+
+
+def sample(mask, k, rng=random):
+    """Picks up to k distinct problem IDs uniformly at random from mask"""
+    count = popcount(mask)
+    if count <= k:
+        problem_ids = ids_of(mask)
+        return rng.sample(problem_ids, len(problem_ids))
+
+    width = mask.bit_length()
+    if k * width <= count * 256 and k * 2 <= count:
+        # Testing a random bit costs about a word per 64 bits, decoding the
+        # mask about a Python iteration per byte, so rejection sampling wins
+        # unless it needs hundreds of tries
+        picked = []
+        seen = set()
+        while len(picked) < k:
+            bit = rng.randrange(width)
+            if bit not in seen and mask >> bit & 1:
+                seen.add(bit)
+                picked.append(bit)
+        return picked
+
+    return rng.sample(ids_of(mask), k)
+
+
+class ProblemIndex:
+    """Precomputed bitmasks over problem IDs, so filtering is a few AND/ANDNOTs"""
+
+    def __init__(self, all_problems, topics, company_to_problems=None):
+        self.all_mask = mask_of(int(key) for key in all_problems)
+        self.topic_masks = {
+            topic: mask_of(problem_ids) for topic, problem_ids in topics.items()
+        }
+        self.any_topic_mask = self.topic_mask(self.topic_masks)
+
+        # difficulty -> sorted problem IDs, and the matching masks
+        self.difficulty_index = {}
+        for key, problem in all_problems.items():
+            difficulty = problem.get("Difficulty")
+            self.difficulty_index.setdefault(difficulty, []).append(int(key))
+        for problem_ids in self.difficulty_index.values():
+            problem_ids.sort()
+        self.difficulty_masks = {
+            difficulty: mask_of(problem_ids)
+            for difficulty, problem_ids in self.difficulty_index.items()
+        }
+
+        # Problems ranked by catalog frequency, as (-frequency, id) pairs
+        self.frequency_ranking = sorted(
+            (-_score(problem.get("Frequency")), int(key))
+            for key, problem in all_problems.items()
+        )
+
+        # company -> duration -> mask, plus the union of all durations per company.
+        # Each company also gets its problems ranked by their best frequency
+        # over all durations, and within each duration, as (-frequency, id)
+        # pairs ready for heapq.merge, and its (IDs, weights) arrays for the
+        # Common ranking
+        self.company_duration_masks = {}
+        self.company_masks = {}
+        self.company_rankings = {}
+        self.company_duration_rankings = {}
+        self.company_problems = {}
+        for company, durations in (company_to_problems or {}).items():
+            # best_scores ranks problems for Top. weights is the inverted index
+            # for Common: each problem the company asks, weighted by its
+            # frequency in every window
+            best_scores = {}
+            weights = {}
+            duration_rankings = {}
+            for duration, problems in durations.items():
+                duration_weight = DURATION_WEIGHTS.get(duration, 1)
+                ranking = duration_rankings[duration] = []
+                for leetcode_id, frequency in problems.items():
+                    leetcode_id = int(leetcode_id)
+                    score = _score(frequency)
+                    ranking.append((-score, leetcode_id))
+                    best_scores[leetcode_id] = max(
+                        score, best_scores.get(leetcode_id, 0.0)
+                    )
+                    weights[leetcode_id] = (
+                        weights.get(leetcode_id, 0.0) + duration_weight * score
+                    )
+            self.company_problems[company] = (
+                array("I", weights),
+                array("d", weights.values()),
+            )
+            self.company_rankings[company] = sorted(
+                (-score, leetcode_id) for leetcode_id, score in best_scores.items()
+            )
+            # The same ranking within each window, for company:duration lists
+            for ranking in duration_rankings.values():
+                ranking.sort()
+            self.company_duration_rankings[company] = duration_rankings
+            self.company_duration_masks[company] = {
+                duration: mask_of(int(leetcode_id) for leetcode_id in problems)
+                for duration, problems in durations.items()
+            }
+            company_mask = 0
+            for duration_mask in self.company_duration_masks[company].values():
+                company_mask |= duration_mask
+            self.company_masks[company] = company_mask
+
+        # Each topic's problems sorted by estimated rating, as parallel lists
+        # of ratings and IDs to bisect, with aliases sharing their topic's
+        self.topic_name = topic_names(topics)
+        self.problem_topics = problem_topics(topics)
+        self.topic_ratings = {}
+        for topic, canonical in self.topic_name.items():
+            if topic == canonical:
+                ranked = sorted(
+                    (problem_rating(all_problems[str(leetcode_id)]), leetcode_id)
+                    for leetcode_id in topics[topic]
+                    if str(leetcode_id) in all_problems
+                )
+                self.topic_ratings[topic] = (
+                    [rating for rating, _ in ranked],
+                    [leetcode_id for _, leetcode_id in ranked],
+                )
+        for topic, canonical in self.topic_name.items():
+            self.topic_ratings[topic] = self.topic_ratings[canonical]
+
+        # Weights for weighted random picks and an alias table to draw from them
+        company_counts = {}
+        for ranking in self.company_rankings.values():
+            for _, leetcode_id in ranking:
+                company_counts[leetcode_id] = company_counts.get(leetcode_id, 0) + 1
+        max_frequency = -self.frequency_ranking[0][0] if self.frequency_ranking else 0
+        self.weighted_ids = sorted(int(key) for key in all_problems)
+        self.weight_of = {
+            leetcode_id: problem_weight(
+                all_problems[str(leetcode_id)],
+                company_counts.get(leetcode_id, 0),
+                max_frequency,
+            )
+            for leetcode_id in self.weighted_ids
+        }
+        self.alias_table = AliasTable(
+            [self.weight_of[leetcode_id] for leetcode_id in self.weighted_ids]
+        )
+
+    def difficulty_mask(self, difficulty_list):
+        """Returns the union of the masks of the given difficulties"""
+        mask = 0
+        for difficulty in difficulty_list:
+            mask |= self.difficulty_masks.get(difficulty, 0)
+        return mask
+
+    def topic_mask(self, topic_list):
+        """Returns the union of the masks of the given topics"""
+        mask = 0
+        for topic in topic_list:
+            mask |= self.topic_masks.get(topic, 0)
+        return mask
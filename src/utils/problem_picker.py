@@ -1,6 +1,194 @@
+import heapq
 import random
-import itertools
 from src.data.loader import load_completed_list
+from src.utils.lazy_imports import load_numpy
+from src.utils.problem_index import ProblemIndex, ids_of, mask_of, popcount, sample
+from src.utils.profiling import stage
+from src.utils.skill_ratings import SkillRatings, level_up
+from src.utils.weighted_sampler import FenwickSampler
+
+SKIP_LISTS = ["hard", "revisit", "refresh"]
+
+
+def build_skip_mask(user_data, completed=None):
+    """Returns the mask of completed problems and those on the user's skip lists"""
+    if completed is None:
+        completed = load_completed_list(user_data)
+    skip_set = set(completed)
+    for maybe_skip in SKIP_LISTS:
+        if maybe_skip in user_data:
+            skip_set.update(user_data[maybe_skip])
+    return mask_of(skip_set)
+
+
+def company_mask(index, list_name):
+    """
+    Returns the mask of a company name, or of one of its time windows given as
+    company:duration (e.g. google:6months), or None if list_name is neither
+    """
+    company, _, duration = list_name.partition(":")
+    if company not in index.company_masks:
+        return None
+    if not duration:
+        return index.company_masks[company]
+    durations = index.company_duration_masks[company]
+    if duration not in durations:
+        raise ValueError(
+            f"Unknown duration for {company}: {duration} "
+            f"(choose from {', '.join(sorted(durations))})"
+        )
+    return durations[duration]
+
+
+def build_problem_mask(catalog, list_names):
+    """Resolves --list names (user lists, companies or 'all') into a problem mask"""
+    if "all" in [e.lower() for e in list_names]:
+        return catalog.index.all_mask
+
+    problem_mask = 0
+    for elem in list_names:
+        if elem.lower() in catalog.user_data:
+            problem_mask |= mask_of(catalog.user_data[elem.lower()])
+        else:
+            problem_mask |= company_mask(catalog.index, elem) or 0
+    return problem_mask
+
+
+def list_companies(catalog, list_names):
+    """
+    Returns the companies named in --list, kept as company:duration when a
+    window is given, or the user's companies if none are named
+    """
+    companies = []
+    for elem in list_names:
+        company = elem.partition(":")[0]
+        if company in catalog.index.company_masks and elem not in companies:
+            companies.append(elem)
+    return companies or sorted(catalog.my_companies)
+
+
+def company_ranking(index, company):
+    """
+    Returns the presorted (-frequency, id) ranking of a company, or of one of
+    its windows given as company:duration, or None if there is none
+    """
+    name, _, duration = company.partition(":")
+    if duration:
+        return index.company_duration_rankings.get(name, {}).get(duration)
+    return index.company_rankings.get(name)
+
+
+def top_problems(index, candidates, companies, k):
+    """
+    Returns the k candidates asked most frequently by the given companies (or
+    across the whole catalog if none are known), within its window for a
+    company given as company:duration. The rankings are presorted, so this
+    merges their heads instead of sorting every candidate.
+    """
+    if k <= 0:
+        return []
+    rankings = [
+        ranking
+        for ranking in (company_ranking(index, company) for company in companies or [])
+        if ranking is not None
+    ]
+    if not rankings:
+        rankings = [index.frequency_ranking]
+
+    picked = []
+    seen = set()
+    for _, problem_id in heapq.merge(*rankings):
+        if problem_id in seen or not candidates >> problem_id & 1:
+            continue
+        seen.add(problem_id)
+        picked.append(problem_id)
+        if len(picked) == k:
+            break
+    return picked
+
+
+def _common_totals(index, companies):
+    """Problem ID -> (companies asking it, summed weight), as sparse pairs"""
+    numpy = load_numpy()
+    postings = [index.company_problems[company] for company in companies]
+    if numpy is not None:
+        ids = numpy.concatenate(
+            [numpy.frombuffer(ids, dtype=numpy.uint32) for ids, _ in postings]
+        )
+        weights = numpy.concatenate(
+            [numpy.frombuffer(weights, dtype=numpy.float64) for _, weights in postings]
+        )
+        counts = numpy.bincount(ids)
+        sums = numpy.bincount(ids, weights=weights)
+        asked = numpy.flatnonzero(counts)
+        return zip(asked.tolist(), counts[asked].tolist(), sums[asked].tolist())
+
+    totals = {}
+    for ids, weights in postings:
+        for leetcode_id, weight in zip(ids, weights):
+            count, total = totals.get(leetcode_id, (0, 0.0))
+            totals[leetcode_id] = (count + 1, total + weight)
+    return ((leetcode_id, *total) for leetcode_id, total in totals.items())
+
+
+def common_problems(index, candidates, companies, k):
+    """
+    Returns the k candidates asked by the most of the given companies, ties
+    going to the most frequently asked across their windows. The counts come
+    from one pass over the companies' posting arrays, and a bounded
+    heap keeps the best k.
+    """
+    # Windows already weigh into a company's weights, so only names count here
+    companies = list(
+        dict.fromkeys(
+            company.partition(":")[0]
+            for company in companies or []
+            if company.partition(":")[0] in index.company_problems
+        )
+    )
+    if not companies:
+        return []
+    best = heapq.nlargest(
+        k,
+        (
+            (count, weight, -leetcode_id)
+            for leetcode_id, count, weight in _common_totals(index, companies)
+            if candidates >> leetcode_id & 1
+        ),
+    )
+    return [-negated_id for _, _, negated_id in best]
+
+
+def weighted_sample(index, candidates, k, rng=random):
+    """
+    Draws up to k distinct candidates without replacement, proportionally to
+    their weights. Draws come from the catalog-wide alias table and are
+    rejected when they miss the candidates; when candidates are too sparse
+    for that to work, a Fenwick tree over just the candidates is used.
+    """
+    count = popcount(candidates)
+    target = min(k, count)
+    picked = []
+    seen = set()
+
+    if count * 8 >= len(index.weighted_ids):
+        attempts = 0
+        while len(picked) < target and attempts < 64 * target:
+            attempts += 1
+            problem_id = index.weighted_ids[index.alias_table.draw(rng)]
+            if problem_id not in seen and candidates >> problem_id & 1:
+                seen.add(problem_id)
+                picked.append(problem_id)
+        if len(picked) == target:
+            return picked
+
+    remaining = [
+        problem_id for problem_id in ids_of(candidates) if problem_id not in seen
+    ]
+    sampler = FenwickSampler(index.weight_of[problem_id] for problem_id in remaining)
+    while len(picked) < target:
+        picked.append(remaining[sampler.pop(rng)])
+    return picked
 
 
 def pick_problems(
@@ -13,45 +201,52 @@ def pick_problems(
     difficulty_list=None,
     k=5,
     problem_type="Random",
+    index=None,
+    skip_mask=None,
+    companies=None,
+    ratings=None,
 ):
-    # Get problems matching the requested topics
-    selected_topics = set(
-        itertools.chain(*[topics.get(topic, []) for topic in topic_list])
-    )
+    with stage("filter"):
+        # problems may be given as IDs or as a mask from the index
+        if index is None:
+            index = ProblemIndex(all_problems, topics)
+        problems_mask = problems if isinstance(problems, int) else mask_of(problems)
 
-    # Get problems to exclude based on excluded topics
-    excluded_problems = set()
-    if exclude_topics:
-        excluded_problems = set(
-            itertools.chain(*[topics.get(topic, []) for topic in exclude_topics])
-        )
+        # Get problems matching the requested topics
+        candidates = problems_mask & index.topic_mask(topic_list) & index.all_mask
 
-    # Get skip set from completed problems and other lists
-    skip_set = set(load_completed_list(user_data))
-    for maybe_skip in ["hard", "revisit", "refresh"]:
-        if maybe_skip in user_data:
-            skip_set.update(user_data[maybe_skip])
+        # Drop problems that belong to excluded topics
+        if exclude_topics:
+            candidates &= ~index.topic_mask(exclude_topics)
 
-    problems_set = set(problems)
-    all_problems_set = set(int(key) for key in all_problems.keys())
+        # Skip completed problems and other lists, unless a session already knows them
+        if skip_mask is None:
+            skip_mask = build_skip_mask(user_data)
+        candidates &= ~skip_mask
 
-    # Apply inclusion and exclusion filters
-    problem_set = (
-        (problems_set & selected_topics & all_problems_set)
-        - skip_set
-        - excluded_problems
-    )
+        # Filter by difficulty if specified
+        if difficulty_list:
+            candidates &= index.difficulty_mask(difficulty_list)
 
-    # Filter by difficulty if specified
-    if difficulty_list:
-        difficulty_problems = set()
-        for problem_id in problem_set:
-            problem_info = all_problems.get(str(problem_id))
-            if problem_info and problem_info.get("Difficulty") in difficulty_list:
-                difficulty_problems.add(problem_id)
-        problem_set = difficulty_problems
+    with stage("sample"):
+        return select(
+            problem_type, index, candidates, k, topic_list, companies, ratings
+        )
 
+
+def select(
+    problem_type, index, candidates, k, topic_list, companies=None, ratings=None
+):
+    """Picks k of the candidates in the way problem_type asks for"""
     if problem_type == "Random":
-        return random.sample(list(problem_set), min(len(problem_set), k))
+        return sample(candidates, k)
+    if problem_type == "Top":
+        return top_problems(index, candidates, companies, k)
+    if problem_type == "Weighted":
+        return weighted_sample(index, candidates, k)
+    if problem_type == "Common":
+        return common_problems(index, candidates, companies, k)
+    if problem_type == "LevelUp":
+        return level_up(index, candidates, topic_list, ratings or SkillRatings(), k)
 
     return []
@@ -1,23 +1,154 @@
+import contextlib
 import datetime
 import json
 import re
 import os
+from src.data.history import AttemptStore
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
-def get_data_path(filename):
+MARKS_JOURNAL = "marks.csv"
+# Held while compacting, so overlapping CLI runs, batch workers and the
+# daemon never fold the same journal at once
+COMPACT_LOCK = "marks.lock"
+MARK_TYPES = ["hard", "revisit", "refresh"]
+# Journals longer than this are folded back into user.json when loaded
+COMPACT_THRESHOLD = 100
+
+
+def get_data_path(filename, data_dir="data"):
     if filename.startswith("data/"):
         return filename
-    return os.path.join("data", filename)
+    return os.path.join(data_dir, filename)
 
 
-def mark_completed(leetcode_id, was_solved, num_errs, time):
-    with open(get_data_path("completed.csv"), "a") as f:
+def mark_completed(leetcode_id, was_solved, num_errs, time, data_dir="data"):
+    csv_path = get_data_path("completed.csv", data_dir)
+    with open(csv_path, "a") as f:
         f.write(
             f"\n{leetcode_id},{was_solved},{num_errs},{time},{datetime.datetime.now():%Y-%m-%d}"
         )
+    # Appends the new row to the columnar store too, if there is one
+    store = AttemptStore.for_csv(csv_path)
+    if store.exists():
+        store.sync(csv_path)
+
+
+def mark_problem(user_data, mark_type, leetcode_id, data_dir="data"):
+    """
+    Records a mark as one appended journal line instead of rewriting user.json,
+    so concurrent sessions cannot overwrite each other's marks
+    """
+    user_data.setdefault(mark_type, []).append(leetcode_id)
+    # Shared, so appends only wait for a compaction moving the journal away
+    with compaction_lock(data_dir, shared=True):
+        with open(get_data_path(MARKS_JOURNAL, data_dir), "a") as f:
+            f.write(f"{mark_type},{leetcode_id},{datetime.datetime.now():%Y-%m-%d}\n")
+
+
+def read_marks(journal_path):
+    """Returns the (mark_type, leetcode_id) events recorded in a journal file"""
+    if not os.path.exists(journal_path):
+        return []
+    marks = []
+    with open(journal_path) as f:
+        for line in f.read().splitlines():
+            try:
+                mark_type, leetcode_id = line.split(",")[:2]
+                if mark_type in MARK_TYPES:
+                    marks.append((mark_type, int(leetcode_id)))
+            except ValueError:
+                continue
+    return marks
+
+
+def load_marks(data_dir="data"):
+    """Returns all journaled marks, including any left by an interrupted compaction"""
+    journal_path = get_data_path(MARKS_JOURNAL, data_dir)
+    return read_marks(f"{journal_path}.compacting") + read_marks(journal_path)
+
+
+def apply_marks(user_data, marks):
+    """Folds journal events into user_data. Folding the same marks twice is harmless"""
+    for mark_type, leetcode_id in marks:
+        marked = user_data.setdefault(mark_type, [])
+        if leetcode_id not in marked:
+            marked.append(leetcode_id)
+    return user_data
+
+
+def write_user_data(user_data, data_dir="data"):
+    """Replaces user.json atomically, so readers never see it half-written"""
+    path = get_data_path("user.json", data_dir)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w") as f:
+            f.write(re.sub(r",\n    ", ",", json.dumps(user_data, indent=2)))
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+@contextlib.contextmanager
+def compaction_lock(data_dir="data", wait=True, shared=False):
+    """
+    Yields whether this process got the compaction lock, shared by journal
+    appends and exclusive to a compaction. Without wait it gives up at once
+    when the lock is taken. Without fcntl only waiting callers go ahead.
+    """
+    if fcntl is None:
+        yield wait
+        return
+    with open(get_data_path(COMPACT_LOCK, data_dir), "a") as lock:
+        mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        try:
+            fcntl.flock(lock, mode | (0 if wait else fcntl.LOCK_NB))
+        except BlockingIOError:
+            locked = False
+        else:
+            locked = True
+        try:
+            yield locked
+        finally:
+            if locked:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def compact_marks(data_dir="data", wait=True):
+    """
+    Folds the marks journal into user.json and starts a new, empty journal.
+    Returns the number of marks folded, 0 when another process is already
+    compacting and wait is False.
+    """
+    with compaction_lock(data_dir, wait) as locked:
+        if not locked:
+            return 0
+        return _compact_marks(data_dir)
+
+
+def _compact_marks(data_dir):
+    journal_path = get_data_path(MARKS_JOURNAL, data_dir)
+    compacting_path = f"{journal_path}.compacting"
 
+    # Marks made while compacting go to a fresh journal instead of being lost.
+    # A leftover from an interrupted compaction is folded first, the current
+    # journal is then picked up by the next compaction.
+    if os.path.exists(journal_path) and not os.path.exists(compacting_path):
+        os.replace(journal_path, compacting_path)
+    if not os.path.exists(compacting_path):
+        return 0
 
-def mark_problem(user_data, mark_type, leetcode_id):
-    user_data[mark_type].append(leetcode_id)
-    with open(get_data_path("user.json"), "w") as f:
-        f.write(re.sub(r",\n    ", ",", json.dumps(user_data, indent=2)))
+    marks = read_marks(compacting_path)
+    with open(get_data_path("user.json", data_dir)) as f:
+        user_data = json.load(f)
+    write_user_data(apply_marks(user_data, marks), data_dir)
+    try:
+        os.remove(compacting_path)
+    except FileNotFoundError:
+        # Already folded by a compaction that did not take the lock
+        pass
+    return len(marks)
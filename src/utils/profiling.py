@@ -0,0 +1,115 @@
+"""
+Per-stage timings for a single run, switched on with --profile or LCPP_PROFILE.
+Code marks its stages with `with stage(name):`, which costs next to nothing
+while profiling is off. Stages nest, so a stage's time includes the stages it
+triggers (loading the index loads all_problems.json, for example).
+"""
+
+import contextlib
+import json
+import os
+import sys
+import time
+
+# Set to 1 (or -) to print the report to stderr, or to a file to append it to
+PROFILE_ENV = "LCPP_PROFILE"
+
+# name -> [calls, seconds, allocated blocks], None while not profiling
+_stages = None
+
+
+@contextlib.contextmanager
+def stage(name):
+    if _stages is None:
+        yield
+        return
+    blocks = sys.getallocatedblocks()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record = _stages.setdefault(name, [0, 0.0, 0])
+        record[0] += 1
+        record[1] += time.perf_counter() - start
+        record[2] += sys.getallocatedblocks() - blocks
+
+
+def profile_destination(option=None):
+    """Where the report goes: '-' for stderr, a file path, or None for nowhere"""
+    destination = option or os.environ.get(PROFILE_ENV)
+    if not destination or destination == "0":
+        return None
+    return "-" if destination == "1" else destination
+
+
+def write_report(report, destination):
+    """Writes report as one JSON line, so runs appended to a file aggregate easily"""
+    line = json.dumps(report)
+    if destination == "-":
+        print(line, file=sys.stderr)
+    else:
+        with open(destination, "a") as f:
+            f.write(line + "\n")
+
+
+@contextlib.contextmanager
+def profiled(command, destination=None, cprofile_path=None, tracemalloc_path=None):
+    """
+    Profiles the enclosed run. The stage report goes to destination, the
+    cProfile stats (for pstats/snakeviz) and the tracemalloc snapshot (for
+    tracemalloc.Snapshot.load) are dumped to their paths when given.
+    """
+    global _stages
+    if destination is None and cprofile_path is None and tracemalloc_path is None:
+        yield
+        return
+
+    # Imported here so the daemon client, which checks for profiling, stays light
+    import cProfile
+    import tracemalloc
+    from datetime import datetime
+
+    _stages = {}
+    profiler = cProfile.Profile() if cprofile_path else None
+    if tracemalloc_path:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    started = datetime.now().isoformat(timespec="seconds")
+    start = time.perf_counter()
+    exit_code = 0
+    try:
+        yield
+    except SystemExit as e:
+        # sys.exit() means success, sys.exit("message") a failure
+        if e.code is None:
+            exit_code = 0
+        else:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        raise
+    except BaseException:
+        exit_code = 1
+        raise
+    finally:
+        total = time.perf_counter() - start
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(cprofile_path)
+        if tracemalloc_path:
+            tracemalloc.take_snapshot().dump(tracemalloc_path)
+            tracemalloc.stop()
+        if destination:
+            write_report(
+                {
+                    "command": list(command),
+                    "started": started,
+                    "exit_code": exit_code,
+                    "total_seconds": total,
+                    "stages": {
+                        name: {"calls": calls, "seconds": seconds, "blocks": blocks}
+                        for name, (calls, seconds, blocks) in _stages.items()
+                    },
+                },
+                destination,
+            )
+        _stages = None
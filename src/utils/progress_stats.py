@@ -0,0 +1,197 @@
+import statistics
+from datetime import date, timedelta
+from src.utils.lazy_imports import load_numpy
+
+DIFFICULTIES = ["Easy", "Medium", "Hard"]
+# 1970-01-01, day 0 of the attempt history, was a Thursday
+_EPOCH = date(1970, 1, 1)
+_MONDAY_OFFSET = 3
+
+
+def canonical_topics(topics):
+    """Topic -> problem IDs without aliases, which share their topic's list"""
+    seen = set()
+    canonical = {}
+    for topic, problem_ids in topics.items():
+        if id(problem_ids) not in seen:
+            seen.add(id(problem_ids))
+            canonical[topic] = problem_ids
+    return canonical
+
+
+class _NumpyTotals:
+    """Per-problem totals over all attempts, computed with array operations"""
+
+    def __init__(self, columns, size):
+        numpy = load_numpy()
+        self.ids = numpy.asarray(columns["id"], dtype=numpy.int64)
+        solved = numpy.asarray(columns["solved"]) == 1
+        errors = numpy.asarray(columns["errors"], dtype=numpy.int64)
+        minutes = numpy.asarray(columns["minutes"], dtype=numpy.int64)
+        size = max(size, int(self.ids.max()) + 1 if len(self.ids) else 0)
+
+        self.attempts = numpy.bincount(self.ids, minlength=size)
+        self.solved = numpy.bincount(self.ids, weights=solved, minlength=size)
+        counted = errors >= 0
+        self.errors = numpy.bincount(
+            self.ids[counted], weights=errors[counted], minlength=size
+        )
+        self.error_attempts = numpy.bincount(self.ids[counted], minlength=size)
+        # Solve times, skipping quick marks recorded without one
+        timed = solved & (minutes > 0)
+        self.timed_ids = self.ids[timed]
+        self.timed_minutes = minutes[timed]
+        self.size = size
+
+    def group(self, problem_ids):
+        numpy = load_numpy()
+        problem_ids = numpy.asarray(problem_ids, dtype=numpy.int64)
+        member = numpy.zeros(self.size, dtype=bool)
+        member[problem_ids] = True
+        minutes = self.timed_minutes[member[self.timed_ids]]
+        return (
+            int(numpy.count_nonzero(self.solved[problem_ids])),
+            int(self.attempts[problem_ids].sum()),
+            int(self.solved[problem_ids].sum()),
+            float(self.errors[problem_ids].sum()),
+            int(self.error_attempts[problem_ids].sum()),
+            float(numpy.median(minutes)) if len(minutes) else None,
+        )
+
+
+class _PythonTotals:
+    """The same totals in plain Python, for when NumPy is not installed"""
+
+    def __init__(self, columns, size):
+        ids = columns["id"]
+        size = max([size] + [max(ids) + 1 if len(ids) else 0])
+        self.attempts = [0] * size
+        self.solved = [0] * size
+        self.errors = [0] * size
+        self.error_attempts = [0] * size
+        self.minutes = [None] * size
+        for leetcode_id, solved, errors, minutes in zip(
+            ids, columns["solved"], columns["errors"], columns["minutes"]
+        ):
+            self.attempts[leetcode_id] += 1
+            if errors >= 0:
+                self.errors[leetcode_id] += errors
+                self.error_attempts[leetcode_id] += 1
+            if solved == 1:
+                self.solved[leetcode_id] += 1
+                if minutes > 0:
+                    if self.minutes[leetcode_id] is None:
+                        self.minutes[leetcode_id] = []
+                    self.minutes[leetcode_id].append(minutes)
+
+    def group(self, problem_ids):
+        minutes = []
+        for leetcode_id in problem_ids:
+            minutes.extend(self.minutes[leetcode_id] or ())
+        return (
+            sum(1 for leetcode_id in problem_ids if self.solved[leetcode_id]),
+            sum(self.attempts[leetcode_id] for leetcode_id in problem_ids),
+            sum(self.solved[leetcode_id] for leetcode_id in problem_ids),
+            sum(self.errors[leetcode_id] for leetcode_id in problem_ids),
+            sum(self.error_attempts[leetcode_id] for leetcode_id in problem_ids),
+            statistics.median(minutes) if minutes else None,
+        )
+
+
+def _summary(totals, problem_ids):
+    completed, attempts, solved, errors, error_attempts, median = totals.group(
+        problem_ids
+    )
+    return {
+        "problems": len(problem_ids),
+        "completed": completed,
+        "completion_rate": completed / len(problem_ids) if problem_ids else 0.0,
+        "attempts": attempts,
+        "solve_rate": solved / attempts if attempts else None,
+        "errors_per_attempt": errors / error_attempts if error_attempts else None,
+        "median_minutes": median,
+    }
+
+
+def weekly_throughput(columns, weeks, problem_ids=None):
+    """
+    (week starting Monday, attempts, solved attempts) for the last weeks
+    weeks, counting only attempts on problem_ids when given
+    """
+    days = columns["day"]
+    solved = columns["solved"]
+    numpy = load_numpy()
+    if numpy is not None:
+        days = numpy.asarray(days, dtype=numpy.int64)
+        dated = days >= 0
+        if problem_ids is not None:
+            ids = numpy.asarray(columns["id"], dtype=numpy.int64)
+            size = max(max(problem_ids, default=-1), int(ids.max(initial=-1))) + 1
+            member = numpy.zeros(size, dtype=bool)
+            member[problem_ids] = True
+            dated &= member[ids]
+        if not dated.any():
+            return []
+        week_numbers = (days[dated] + _MONDAY_OFFSET) // 7
+        first = int(week_numbers.max()) - weeks + 1
+        recent = week_numbers >= first
+        attempts = numpy.bincount(week_numbers[recent] - first, minlength=weeks)
+        solved_attempts = numpy.bincount(
+            week_numbers[recent] - first,
+            weights=(numpy.asarray(solved)[dated] == 1)[recent],
+            minlength=weeks,
+        )
+    else:
+        counted = None if problem_ids is None else set(problem_ids)
+        rows = [
+            (day, was_solved)
+            for leetcode_id, day, was_solved in zip(columns["id"], days, solved)
+            if day >= 0 and (counted is None or leetcode_id in counted)
+        ]
+        if not rows:
+            return []
+        first = max((day + _MONDAY_OFFSET) // 7 for day, _ in rows) - weeks + 1
+        attempts = [0] * weeks
+        solved_attempts = [0] * weeks
+        for day, was_solved in rows:
+            week = (day + _MONDAY_OFFSET) // 7 - first
+            if week >= 0:
+                attempts[week] += 1
+                solved_attempts[week] += was_solved == 1
+    return [
+        (
+            _EPOCH + timedelta(days=(first + week) * 7 - _MONDAY_OFFSET),
+            int(attempts[week]),
+            int(solved_attempts[week]),
+        )
+        for week in range(weeks)
+    ]
+
+
+def progress_stats(catalog, weeks=12):
+    """
+    Completion rate, solve rate, errors per attempt and median solve time over
+    the whole practice history, overall and per difficulty and topic, plus the
+    number of attempts in each of the last weeks weeks
+    """
+    columns = catalog.storage.load_attempts()
+    all_ids = [int(key) for key in catalog.all_problems]
+    topics = canonical_topics(catalog.topics)
+    size = max([-1] + all_ids + [max(ids, default=-1) for ids in topics.values()]) + 1
+    totals_class = _NumpyTotals if load_numpy() is not None else _PythonTotals
+    totals = totals_class(columns, size)
+
+    difficulty_index = catalog.index.difficulty_index
+    return {
+        "overall": _summary(totals, all_ids),
+        "difficulty": {
+            difficulty: _summary(totals, difficulty_index.get(difficulty, []))
+            for difficulty in DIFFICULTIES
+        },
+        "topic": {
+            topic: _summary(totals, problem_ids)
+            for topic, problem_ids in sorted(topics.items())
+        },
+        # Attempts on problems missing from the catalog count nowhere else either
+        "weekly": weekly_throughput(columns, weeks, all_ids),
+    }
@@ -0,0 +1,224 @@
+import heapq
+import os
+import pickle
+from datetime import date
+from src.data.snapshot import get_snapshot_path, write_pickles
+from src.utils.profiling import stage
+
+# Lists whose problems are scheduled for spaced repetition
+REVIEW_LISTS = ["revisit", "refresh"]
+# Bump whenever the layout of the saved schedule changes
+SCHEDULE_VERSION = 2
+INITIAL_EASINESS = 2.5
+MIN_EASINESS = 1.3
+# Solve times past which a solved attempt counts as a harder recall
+TARGET_MINUTES = {"Easy": 15, "Medium": 30, "Hard": 50}
+_EPOCH = date(1970, 1, 1).toordinal()
+
+
+def today():
+    """Today as a day number, counted like the attempt history's days"""
+    return date.today().toordinal() - _EPOCH
+
+
+def day_to_date(day):
+    return date.fromordinal(day + _EPOCH)
+
+
+def attempt_quality(solved, num_errs, minutes, difficulty):
+    """Grades an attempt 0-5 the way SM-2 expects: below 3 means forgotten"""
+    if solved != 1:
+        return 1
+    quality = 5
+    if num_errs > 0:
+        quality -= 1
+    if num_errs > 2:
+        quality -= 1
+    if minutes > TARGET_MINUTES.get(difficulty, 30):
+        quality -= 1
+    return max(quality, 3)
+
+
+class ReviewItem:
+    __slots__ = ["easiness", "repetitions", "interval", "due", "since"]
+
+    def __init__(self, since):
+        self.easiness = INITIAL_EASINESS
+        self.repetitions = 0
+        self.interval = 0
+        # Due right away, then on the dates SM-2 picks after each review
+        self.due = since
+        self.since = since
+
+    def __getstate__(self):
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+
+    def review(self, quality, day):
+        """Applies the SM-2 update for one graded review on day"""
+        if quality < 3:
+            self.repetitions = 0
+            self.interval = 1
+        else:
+            self.repetitions += 1
+            if self.repetitions == 1:
+                self.interval = 1
+            elif self.repetitions == 2:
+                self.interval = 6
+            else:
+                self.interval = round(self.interval * self.easiness)
+        self.easiness = max(
+            MIN_EASINESS,
+            self.easiness + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02),
+        )
+        self.due = day + self.interval
+
+
+class ReviewSchedule:
+    """
+    SM-2 schedule for the problems on the revisit and refresh lists. Due dates
+    live in a heap with lazy deletion: rescheduling pushes a new entry and the
+    outdated one is dropped when it reaches the top, so finding what is due
+    costs O(log n) per item. The schedule is saved with its position in the
+    attempt history, so loading it only reads attempts recorded since.
+    """
+
+    def __init__(self):
+        self.items = {}
+        self.heap = []
+        # Where applying the attempt history stopped, see load_attempts_since
+        self.position = None
+
+    def add(self, leetcode_id, day):
+        if leetcode_id not in self.items:
+            item = ReviewItem(day)
+            self.items[leetcode_id] = item
+            heapq.heappush(self.heap, (item.due, leetcode_id))
+
+    def remove(self, leetcode_id):
+        # Its heap entry is dropped once it surfaces
+        self.items.pop(leetcode_id, None)
+
+    def record_attempt(self, leetcode_id, quality, day):
+        item = self.items.get(leetcode_id)
+        if item is not None and day >= item.since:
+            item.review(quality, day)
+            heapq.heappush(self.heap, (item.due, leetcode_id))
+
+    def _is_current(self, entry):
+        item = self.items.get(entry[1])
+        return item is not None and item.due == entry[0]
+
+    def next_due(self):
+        """Returns (due day, problem ID) of the earliest review, or None"""
+        while self.heap and not self._is_current(self.heap[0]):
+            heapq.heappop(self.heap)
+        return self.heap[0] if self.heap else None
+
+    def due(self, day=None, k=None):
+        """Returns up to k problem IDs due on or before day, most overdue first"""
+        day = today() if day is None else day
+        due = []
+        popped = []
+        while k is None or len(due) < k:
+            entry = self.next_due()
+            if entry is None or entry[0] > day:
+                break
+            popped.append(heapq.heappop(self.heap))
+            # A problem unmarked and marked again may have two current entries
+            if entry[1] not in due:
+                due.append(entry[1])
+        for entry in popped:
+            heapq.heappush(self.heap, entry)
+        return due
+
+
+def get_schedule_path(user_dir="data"):
+    return get_snapshot_path("review_schedule", os.path.join(user_dir, ".cache"))
+
+
+def load_schedule(schedule_path):
+    try:
+        with open(schedule_path, "rb") as f:
+            state = pickle.load(f)
+        if state["version"] == SCHEDULE_VERSION:
+            return state["schedule"]
+    except Exception:
+        # Missing or stale-format schedules are rebuilt from the history
+        pass
+    return ReviewSchedule()
+
+
+def save_schedule(schedule, schedule_path):
+    write_pickles(schedule_path, {"version": SCHEDULE_VERSION, "schedule": schedule})
+
+
+def _replay(schedule, columns, all_problems):
+    ids = columns["id"]
+    for row in range(len(ids)):
+        leetcode_id = int(ids[row])
+        if leetcode_id not in schedule.items:
+            continue
+        problem = all_problems.get(str(leetcode_id), {})
+        quality = attempt_quality(
+            int(columns["solved"][row]),
+            int(columns["errors"][row]),
+            int(columns["minutes"][row]),
+            problem.get("Difficulty"),
+        )
+        day = int(columns["day"][row])
+        schedule.record_attempt(leetcode_id, quality, day if day >= 0 else today())
+
+
+def update_schedule(schedule, catalog):
+    """
+    Applies the attempts recorded since schedule's position, or replays the
+    whole history if it was rewritten. Attempts made before a problem was
+    scheduled do not count for it, so with nothing scheduled the history is
+    skipped to its end unread.
+    """
+    if not schedule.items:
+        schedule.position = catalog.storage.attempts_end()
+        return
+    columns, schedule.position, full = catalog.storage.load_attempts_since(
+        schedule.position
+    )
+    if full:
+        # Replay all of it from the first reviews
+        for leetcode_id, item in list(schedule.items.items()):
+            schedule.items[leetcode_id] = ReviewItem(item.since)
+        schedule.heap = [(item.due, i) for i, item in schedule.items.items()]
+        heapq.heapify(schedule.heap)
+    _replay(schedule, columns, catalog.all_problems)
+
+
+def load_reviews(catalog):
+    """
+    Returns the review schedule of catalog's user, brought up to date with
+    their review lists and attempt history
+    """
+    with stage("reviews"):
+        return _load_reviews(catalog)
+
+
+def _load_reviews(catalog):
+    schedule_path = get_schedule_path(catalog.user_dir)
+    schedule = load_schedule(schedule_path)
+
+    # Follow the lists: new marks are due today, unmarked problems drop out
+    on_lists = set()
+    for list_name in REVIEW_LISTS:
+        on_lists.update(catalog.user_data.get(list_name, []))
+    for leetcode_id in list(schedule.items):
+        if leetcode_id not in on_lists:
+            schedule.remove(leetcode_id)
+    day = today()
+    for leetcode_id in sorted(on_lists):
+        schedule.add(leetcode_id, day)
+
+    update_schedule(schedule, catalog)
+    save_schedule(schedule, schedule_path)
+    return schedule
@@ -0,0 +1,187 @@
+import os
+import pickle
+from bisect import bisect_left
+from src.data.snapshot import get_snapshot_path, write_pickles
+from src.utils.profiling import stage
+from src.utils.review_scheduler import attempt_quality
+
+# Bump whenever the layout of the saved ratings changes
+RATINGS_VERSION = 2
+INITIAL_RATING = 1200
+# Problem ratings: a base per difficulty, moved by how far the acceptance
+# rate is from 50%, so an easy Hard sits near a hard Medium
+DIFFICULTY_RATINGS = {"Easy": 1000, "Medium": 1400, "Hard": 1800}
+ACCEPTANCE_POINTS = 8
+# The update step shrinks as a topic gets more attempts, like a Glicko
+# rating's deviation: early attempts move it a lot, later ones fine-tune it
+MAX_K = 160
+MIN_K = 24
+# Level Up picks problems rated this far above the user's topic rating
+STRETCH = 50
+
+
+def problem_rating(problem):
+    """Estimated difficulty of a problem, on the same scale as skill ratings"""
+    rating = DIFFICULTY_RATINGS.get(problem.get("Difficulty"), 1400)
+    try:
+        acceptance = float(str(problem.get("Acceptance")).strip().rstrip("%"))
+    except ValueError:
+        return rating
+    return rating + (50 - acceptance) * ACCEPTANCE_POINTS
+
+
+def topic_names(topics):
+    """Topic or alias -> the topic name ratings are kept under"""
+    names = {}
+    by_list = {}
+    for topic, problem_ids in topics.items():
+        names[topic] = by_list.setdefault(id(problem_ids), topic)
+    return names
+
+
+def problem_topics(topics):
+    """Problem ID -> the topics it belongs to, without aliases"""
+    topics_of = {}
+    for topic, canonical in topic_names(topics).items():
+        if topic == canonical:
+            for leetcode_id in topics[topic]:
+                topics_of.setdefault(leetcode_id, []).append(topic)
+    return topics_of
+
+
+class SkillRatings:
+    """
+    Elo ratings per topic, updated with every attempt against the rating of
+    the problem attempted. An attempt scores 0 when unsolved and 0.5-1 when
+    solved, depending on errors and time. Like the review schedule, the
+    ratings are saved with their position in the attempt history, so loading
+    them only reads attempts recorded since.
+    """
+
+    def __init__(self):
+        self.ratings = {}
+        self.attempts = {}
+        # Where applying the attempt history stopped, see load_attempts_since
+        self.position = None
+
+    def rating(self, topic):
+        return self.ratings.get(topic, INITIAL_RATING)
+
+    def record_attempt(self, topics, difficulty, quality):
+        score = (quality - 1) / 4
+        for topic in topics:
+            rating = self.rating(topic)
+            expected = 1 / (1 + 10 ** ((difficulty - rating) / 400))
+            attempts = self.attempts.get(topic, 0)
+            k = max(MIN_K, MAX_K / (1 + attempts) ** 0.5)
+            self.ratings[topic] = rating + k * (score - expected)
+            self.attempts[topic] = attempts + 1
+
+
+def level_up(index, candidates, topic_list, ratings, k):
+    """
+    Returns up to k candidates rated closest above the user's rating in their
+    topic plus STRETCH, or closest below once no harder ones are left. Each
+    topic's problems are presorted by rating, so this bisects to the target
+    and walks outwards instead of scanning every candidate.
+    """
+    if k <= 0:
+        return []
+    names = {}
+    for topic in topic_list:
+        if topic in index.topic_ratings:
+            names.setdefault(id(index.topic_ratings[topic]), topic)
+
+    # (below target, distance from it, ID) of the nearest candidates per topic
+    nearest = []
+    for topic in names.values():
+        problem_ratings, problem_ids = index.topic_ratings[topic]
+        target = ratings.rating(index.topic_name[topic]) + STRETCH
+        start = bisect_left(problem_ratings, target)
+        found = 0
+        for position in range(start, len(problem_ratings)):
+            if candidates >> problem_ids[position] & 1:
+                distance = problem_ratings[position] - target
+                nearest.append((0, distance, problem_ids[position]))
+                found += 1
+                if found == k:
+                    break
+        for position in range(start - 1, -1, -1):
+            if found == k:
+                break
+            if candidates >> problem_ids[position] & 1:
+                distance = target - problem_ratings[position]
+                nearest.append((1, distance, problem_ids[position]))
+                found += 1
+
+    picked = []
+    for _, _, leetcode_id in sorted(nearest):
+        if leetcode_id not in picked:
+            picked.append(leetcode_id)
+            if len(picked) == k:
+                break
+    return picked
+
+
+def get_ratings_path(user_dir="data"):
+    return get_snapshot_path("skill_ratings", os.path.join(user_dir, ".cache"))
+
+
+def load_ratings_file(ratings_path):
+    try:
+        with open(ratings_path, "rb") as f:
+            state = pickle.load(f)
+        if state["version"] == RATINGS_VERSION:
+            return state["ratings"]
+    except Exception:
+        # Missing or stale-format ratings are rebuilt from the history
+        pass
+    return SkillRatings()
+
+
+def save_ratings(ratings, ratings_path):
+    write_pickles(ratings_path, {"version": RATINGS_VERSION, "ratings": ratings})
+
+
+def load_ratings(catalog):
+    """Returns the skill ratings of catalog's user, brought up to date with their history"""
+    with stage("ratings"):
+        return _load_ratings(catalog)
+
+
+def update_ratings(ratings, catalog):
+    """
+    Applies the attempts recorded since ratings' position, or rates the whole
+    history again if it was rewritten. Returns whether anything changed.
+    """
+    columns, position, full = catalog.storage.load_attempts_since(ratings.position)
+    if position == ratings.position:
+        return False
+    if full:
+        ratings.ratings = {}
+        ratings.attempts = {}
+    ratings.position = position
+    topics_of = catalog.index.problem_topics
+    all_problems = catalog.all_problems
+    ids = columns["id"]
+    for row in range(len(ids)):
+        leetcode_id = int(ids[row])
+        problem = all_problems.get(str(leetcode_id), {})
+        quality = attempt_quality(
+            int(columns["solved"][row]),
+            int(columns["errors"][row]),
+            int(columns["minutes"][row]),
+            problem.get("Difficulty"),
+        )
+        ratings.record_attempt(
+            topics_of.get(leetcode_id, []), problem_rating(problem), quality
+        )
+    return True
+
+
+def _load_ratings(catalog):
+    ratings_path = get_ratings_path(catalog.user_dir)
+    ratings = load_ratings_file(ratings_path)
+    if update_ratings(ratings, catalog):
+        save_ratings(ratings, ratings_path)
+    return ratings
@@ -0,0 +1,90 @@
+import math
+import random
+
+
+def problem_weight(problem, num_companies, max_frequency):
+    """
+    Weight of a problem for weighted random picks: favours problems that are
+    asked often, pass often and are asked by many companies. Every problem
+    keeps a non-zero weight so none becomes unreachable.
+    """
+    try:
+        frequency = float(problem.get("Frequency", 0))
+    except (TypeError, ValueError):
+        frequency = 0.0
+    try:
+        acceptance = float(str(problem.get("Acceptance", "0")).rstrip("%")) / 100
+    except ValueError:
+        acceptance = 0.0
+    frequency_factor = frequency / max_frequency if max_frequency > 0 else 0.0
+    return (
+        (frequency_factor + 0.05) * (0.5 + acceptance) * (1 + math.log1p(num_companies))
+    )
+
+
+class AliasTable:
+    """Walker/Vose alias table: O(n) to build, O(1) per weighted draw"""
+
+    def __init__(self, weights):
+        n = len(weights)
+        total = sum(weights)
+        scaled = [weight * n / total for weight in weights] if total else [1.0] * n
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    def draw(self, rng=random):
+        """Returns a position drawn with probability proportional to its weight"""
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+class FenwickSampler:
+    """Fenwick tree over weights: O(n) to build, O(log n) per draw and removal"""
+
+    def __init__(self, weights):
+        self.weights = list(weights)
+        self.size = len(self.weights)
+        self.tree = [0.0] * (self.size + 1)
+        for i, weight in enumerate(self.weights, 1):
+            self.tree[i] += weight
+            parent = i + (i & -i)
+            if parent <= self.size:
+                self.tree[parent] += self.tree[i]
+        self.total = sum(self.weights)
+
+    def _update(self, position, delta):
+        i = position + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def _find(self, value):
+        position = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= self.size and self.tree[nxt] <= value:
+                position = nxt
+                value -= self.tree[nxt]
+            step >>= 1
+        return min(position, self.size - 1)
+
+    def pop(self, rng=random):
+        """Draws a position proportionally to its weight and removes it"""
+        position = self._find(rng.random() * self.total)
+        while self.weights[position] == 0:
+            # Float rounding can land on an emptied slot, draw again
+            position = self._find(rng.random() * self.total)
+        weight = self.weights[position]
+        self.weights[position] = 0.0
+        self._update(position, -weight)
+        self.total -= weight
+        return position